@@ -1,7 +1,11 @@
 from django.contrib import admin
-from .models import OTPVerification, QuestionPaper, StudentNotification, Internship
+from .models import OTPVerification, QuestionPaper, StudentNotification, Internship, NotificationOutbox, PaperBlob, ChunkedUpload, PaperText
 
 admin.site.register(OTPVerification)
 admin.site.register(QuestionPaper)
 admin.site.register(StudentNotification)
-admin.site.register(Internship)
\ No newline at end of file
+admin.site.register(Internship)
+admin.site.register(NotificationOutbox)
+admin.site.register(PaperBlob)
+admin.site.register(ChunkedUpload)
+admin.site.register(PaperText)
@@ -5,6 +5,8 @@ class AccountsConfig(AppConfig):
     name = 'accounts'
 
     def ready(self):
+        from . import signals  # noqa: F401
+
         try:
             from . import firebase as firebase_module
             firebase_module.initialize()
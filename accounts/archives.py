@@ -0,0 +1,115 @@
+import zipfile
+
+from django.conf import settings
+from django.utils import timezone
+
+from .diskcache import DiskCache
+from .downloads import paper_filename
+from .listings import listing_version
+from .models import QuestionPaper
+
+
+# Bytes read from a paper file (and handed to the response) at a time
+CHUNK_SIZE = 64 * 1024
+
+
+class ZipStream:
+    """Write-only file that keeps what ZipFile writes until take() hands it on.
+
+    It can tell() but not seek(), so ZipFile writes sizes in data descriptors
+    after each entry instead of going back to patch the header.
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.position = 0
+
+    def write(self, data):
+        self.buffer += data
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def take(self):
+        data = bytes(self.buffer)
+        self.buffer.clear()
+        return data
+
+
+def archive_papers(college, branch, semester, doc_type=None):
+    papers = QuestionPaper.objects.filter(college=college, branch=branch, semester=semester)
+    if doc_type:
+        papers = papers.filter(doc_type=doc_type)
+    return list(papers.order_by('doc_type', 'title', 'id'))
+
+
+def archive_entries(papers, by_doc_type=True):
+    """(name in the archive, paper) pairs, numbering repeated names"""
+    seen = set()
+    for paper in papers:
+        filename = paper_filename(paper)
+        if by_doc_type:
+            filename = f"{paper.get_doc_type_display()}/{filename}"
+        name = filename
+        stem, dot, extension = filename.rpartition('.')
+        number = 1
+        while name.lower() in seen:
+            number += 1
+            name = f"{stem}-{number}.{extension}" if dot else f"{filename}-{number}"
+        seen.add(name.lower())
+        yield name, paper
+
+
+def iter_archive(papers, by_doc_type=True):
+    """Stream a ZIP of the papers' files as byte strings, one file chunk at a time.
+
+    Entries are stored rather than deflated (PDFs are already compressed), so
+    memory use is one chunk plus the central directory whatever the total
+    size. Missing files are left out.
+    """
+    stream = ZipStream()
+    with zipfile.ZipFile(stream, 'w', zipfile.ZIP_STORED) as archive:
+        for name, paper in archive_entries(papers, by_doc_type):
+            try:
+                source = paper.file.storage.open(paper.file.name, 'rb')
+            except FileNotFoundError:
+                print(f"⚠️ Left {paper.file.name} out of the archive: file not found")
+                continue
+            info = zipfile.ZipInfo(name, date_time=timezone.localtime(paper.uploaded_at).timetuple()[:6])
+            # Known up front so ZipFile switches to ZIP64 for files over 2GB
+            info.file_size = source.size
+            with source, archive.open(info, 'w') as entry:
+                for chunk in iter(lambda: source.read(CHUNK_SIZE), b''):
+                    entry.write(chunk)
+                    yield stream.take()
+            yield stream.take()
+    yield stream.take()
+
+
+def write_archive(papers, f, by_doc_type=True):
+    for data in iter_archive(papers, by_doc_type):
+        f.write(data)
+
+
+def cached_archive(college, branch, semester, doc_type=None):
+    """Open file of a pre-built archive under PAPER_ZIP_CACHE_DIR, or None when that is unset.
+
+    Archives are named after the listing version, so an upload or delete in
+    the semester makes the next request build a new one; old versions age
+    out of the cache.
+    """
+    cache_dir = getattr(settings, 'PAPER_ZIP_CACHE_DIR', None)
+    if not cache_dir:
+        return None
+    disk_cache = DiskCache(cache_dir, getattr(settings, 'PAPER_ZIP_CACHE_MAX_SIZE', 2 * 1024 * 1024 * 1024))
+    version = listing_version(college, branch, semester)
+    name = f"{college}/{branch}/{semester}/{doc_type or 'all'}/{version}.zip"
+    return disk_cache.open(
+        name,
+        lambda f: write_archive(archive_papers(college, branch, semester, doc_type), f, by_doc_type=not doc_type),
+    )
@@ -0,0 +1,171 @@
+import hashlib
+import os
+from datetime import timedelta
+
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.core.files.uploadhandler import FileUploadHandler
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import PaperBlob
+
+
+class HashingUploadHandler(FileUploadHandler):
+    """Computes the SHA-256 of each uploaded file while it streams in.
+
+    Sits in front of Django's memory/temporary-file handlers and passes every
+    chunk through unchanged; the digests end up on request._upload_digests.
+    """
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.hasher = hashlib.sha256()
+
+    def receive_data_chunk(self, raw_data, start):
+        self.hasher.update(raw_data)
+        return raw_data
+
+    def file_complete(self, file_size):
+        if self.request is not None:
+            if not hasattr(self.request, '_upload_digests'):
+                self.request._upload_digests = {}
+            self.request._upload_digests[self.field_name] = self.hasher.hexdigest()
+        return None
+
+
+def upload_digest(request, upload, field_name='file'):
+    """SHA-256 recorded for an upload, hashing it now if the handler did not run"""
+    digest = getattr(request, '_upload_digests', {}).get(field_name)
+    if digest:
+        return digest
+    hasher = hashlib.sha256()
+    for chunk in upload.chunks():
+        hasher.update(chunk)
+    upload.seek(0)
+    return hasher.hexdigest()
+
+
+BLOB_DIR = 'question_papers/blobs'
+
+
+def blob_name(digest, extension):
+    return f"{BLOB_DIR}/{digest[:2]}/{digest}{extension}"
+
+
+def _locked_blob(digest):
+    return PaperBlob.objects.select_for_update().filter(sha256=digest).first()
+
+
+def _reference(digest, name, size, save):
+    """Take a reference on the blob for digest, creating its row if there is none.
+
+    The row lock serializes this against delete_unreferenced_blob, so a blob
+    brought back from zero references, or created over a file left on disk,
+    checks for its file while nobody can delete it; save(name) writes the
+    content when it is missing and returns the stored name.
+    """
+    with transaction.atomic():
+        blob = _locked_blob(digest)
+        if blob is None:
+            try:
+                with transaction.atomic():
+                    blob = PaperBlob.objects.create(sha256=digest, file=name, size=size, ref_count=0)
+            except IntegrityError:
+                # A concurrent upload of the same content created the blob first
+                blob = _locked_blob(digest)
+
+        if blob.ref_count <= 0 and not default_storage.exists(blob.file.name):
+            saved_name = save(blob.file.name)
+            if saved_name != blob.file.name:
+                PaperBlob.objects.filter(pk=blob.pk).update(file=saved_name)
+                blob.file.name = saved_name
+
+        PaperBlob.objects.filter(pk=blob.pk).update(ref_count=F('ref_count') + 1)
+        blob.ref_count += 1
+        return blob
+
+
+def store_upload(upload, digest):
+    """Take a reference on the blob for this content, storing the bytes only if they are new"""
+    extension = os.path.splitext(upload.name)[1].lower() or '.pdf'
+    return _reference(digest, blob_name(digest, extension), upload.size, lambda name: default_storage.save(name, upload))
+
+
+def store_local_file(path, digest, extension):
+    """store_upload for a file already on local disk, which is consumed.
+
+    With local storage on the same filesystem the file is renamed into place
+    rather than copied.
+    """
+    def save(name):
+        try:
+            target = default_storage.path(name)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            os.replace(path, target)
+            return name
+        except (NotImplementedError, OSError):
+            # Remote storage or another filesystem: fall back to a streamed copy
+            with open(path, 'rb') as f:
+                return default_storage.save(name, File(f, name=os.path.basename(name)))
+
+    blob = _reference(digest, blob_name(digest, extension), os.path.getsize(path), save)
+    if os.path.exists(path):
+        os.remove(path)
+    return blob
+
+
+def release_blob(blob_id):
+    """Drop one reference; the blob and its file go away after the last one is committed"""
+    PaperBlob.objects.filter(pk=blob_id).update(ref_count=F('ref_count') - 1)
+    if PaperBlob.objects.filter(pk=blob_id, ref_count__lte=0).exists():
+        transaction.on_commit(lambda: delete_unreferenced_blob(blob_id))
+
+
+def delete_unreferenced_blob(blob_id):
+    """Delete the blob and its file unless an upload referenced it again meanwhile"""
+    with transaction.atomic():
+        blob = PaperBlob.objects.select_for_update().filter(pk=blob_id, ref_count__lte=0).first()
+        if blob is None:
+            return False
+        default_storage.delete(blob.file.name)
+        blob.delete()
+    return True
+
+
+def purge_unreferenced_blobs(max_age_hours=24):
+    """Remove blobs left at zero references and blob files without a row.
+
+    Rows stay behind when a process dies before its on-commit delete runs;
+    files when an upload stored them inside a transaction that rolled back.
+    Files younger than max_age_hours may belong to an upload still in
+    progress and are kept. Storages that cannot list files only get the
+    row cleanup.
+    """
+    count = 0
+    for blob_id in PaperBlob.objects.filter(ref_count__lte=0).values_list('id', flat=True):
+        count += delete_unreferenced_blob(blob_id)
+
+    cutoff = timezone.now() - timedelta(hours=max_age_hours)
+    try:
+        directories = default_storage.listdir(BLOB_DIR)[0]
+    except (NotImplementedError, FileNotFoundError):
+        return count
+    for directory in directories:
+        for filename in default_storage.listdir(f"{BLOB_DIR}/{directory}")[1]:
+            name = f"{BLOB_DIR}/{directory}/{filename}"
+            digest = os.path.splitext(filename)[0]
+            if PaperBlob.objects.filter(file=name).exists() or default_storage.get_modified_time(name) > cutoff:
+                continue
+            # A placeholder row claims the digest, as _reference would, so an
+            # upload of the same content waits rather than reuse the file
+            try:
+                with transaction.atomic():
+                    PaperBlob.objects.create(sha256=digest, file=name, size=0, ref_count=0)
+                    default_storage.delete(name)
+                    PaperBlob.objects.filter(sha256=digest).delete()
+            except IntegrityError:
+                continue
+            count += 1
+    return count
@@ -0,0 +1,193 @@
+import hashlib
+import os
+import pickle
+import threading
+import time
+import uuid
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from django.core.cache import cache, caches
+from django.core.cache.backends import filebased
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.core.files import locks
+
+
+_MISSING = object()
+
+
+def cache_version(key):
+    """Current version token stored at key, creating one if there is none.
+
+    A random token rather than a counter, so a version key that is evicted
+    can never come back at an old value and resurrect stale entries.
+    """
+    version = cache.get(key)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not cache.add(key, version, None):
+            version = cache.get(key, version)
+    return version
+
+
+def bump_versions(*keys):
+    """Move the version tokens at keys on, orphaning every entry cached under the old ones"""
+    cache.set_many({key: uuid.uuid4().hex for key in keys}, None)
+
+
+class TieredCache(BaseCache):
+    """Per-process LRU in front of a shared cache (the alias named by LOCATION).
+
+    Only keys starting with one of OPTIONS['LOCAL_PREFIXES'] are kept in
+    process memory, for at most LOCAL_TIMEOUT seconds. Other processes cannot
+    reach that memory to invalidate it, so those keys must never change
+    meaning: put a version token (cache_version) in them and bump the version
+    instead of deleting. Version keys and everything else (rate limits, OTPs,
+    markers) always go to the shared tier, so invalidations reach every
+    process on its next read.
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        self.shared_alias = location or 'shared'
+        self.local_prefixes = tuple(options.get('LOCAL_PREFIXES', ()))
+        self.local_timeout = options.get('LOCAL_TIMEOUT', 300)
+        self.local_max_entries = options.get('LOCAL_MAX_ENTRIES', 1000)
+        self._local = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def shared(self):
+        return caches[self.shared_alias]
+
+    def _is_local(self, key):
+        return key.startswith(self.local_prefixes) if self.local_prefixes else False
+
+    def _expiry(self, timeout):
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = self.shared.default_timeout
+        return None if timeout is None else time.time() + timeout
+
+    def _remember(self, key, value, version, expiry=None):
+        local_key = self.make_and_validate_key(key, version)
+        local_expiry = time.time() + self.local_timeout
+        if expiry is not None:
+            local_expiry = min(local_expiry, expiry)
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._local[local_key] = (local_expiry, data)
+            self._local.move_to_end(local_key)
+            while len(self._local) > self.local_max_entries:
+                self._local.popitem(last=False)
+
+    def _recall(self, key, version):
+        local_key = self.make_and_validate_key(key, version)
+        with self._lock:
+            entry = self._local.get(local_key)
+            if entry is None:
+                return _MISSING
+            if entry[0] <= time.time():
+                del self._local[local_key]
+                return _MISSING
+            self._local.move_to_end(local_key)
+        return pickle.loads(entry[1])
+
+    def _forget(self, key, version):
+        local_key = self.make_and_validate_key(key, version)
+        with self._lock:
+            self._local.pop(local_key, None)
+
+    def get(self, key, default=None, version=None):
+        if self._is_local(key):
+            value = self._recall(key, version)
+            if value is not _MISSING:
+                return value
+        value = self.shared.get(key, _MISSING, version=version)
+        if value is _MISSING:
+            return default
+        if self._is_local(key):
+            self._remember(key, value, version)
+        return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.shared.set(key, value, timeout, version=version)
+        if self._is_local(key):
+            self._remember(key, value, version, self._expiry(timeout))
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        added = self.shared.add(key, value, timeout, version=version)
+        if added and self._is_local(key):
+            self._remember(key, value, version, self._expiry(timeout))
+        return added
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.shared.touch(key, timeout, version=version)
+
+    def delete(self, key, version=None):
+        self._forget(key, version)
+        return self.shared.delete(key, version=version)
+
+    def has_key(self, key, version=None):
+        if self._is_local(key) and self._recall(key, version) is not _MISSING:
+            return True
+        return self.shared.has_key(key, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        self._forget(key, version)
+        return self.shared.incr(key, delta, version=version)
+
+    def clear(self):
+        with self._lock:
+            self._local.clear()
+        self.shared.clear()
+
+    def close(self, **kwargs):
+        self.shared.close(**kwargs)
+
+
+class FileBasedCache(filebased.FileBasedCache):
+    """Django's file cache with add() and incr() atomic across the host's processes.
+
+    Django's versions read and then write, so concurrent callers can all
+    succeed; here each holds lock(key), an exclusive lock on one of
+    LOCK_STRIPES lock files chosen by key. incr() also keeps the entry's expiry instead of
+    resetting it to the default timeout.
+    """
+
+    LOCK_STRIPES = 64
+
+    @contextmanager
+    def lock(self, key, version=None):
+        """Hold the exclusive lock for key, for a read-compute-write of its entry"""
+        stripe = int(hashlib.md5(self.make_and_validate_key(key, version).encode()).hexdigest(), 16) % self.LOCK_STRIPES
+        path = os.path.join(self._dir, 'locks', f'{stripe}.lock')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'ab') as f:
+            locks.lock(f, locks.LOCK_EX)
+            try:
+                yield
+            finally:
+                locks.unlock(f)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        with self.lock(key, version):
+            return super().add(key, value, timeout, version)
+
+    def incr(self, key, delta=1, version=None):
+        with self.lock(key, version):
+            try:
+                with open(self._key_to_file(key, version), 'r+b') as f:
+                    if not self._is_expired(f):
+                        f.seek(0)
+                        expiry = pickle.load(f)
+                        value = pickle.loads(zlib.decompress(f.read())) + delta
+                        f.seek(0)
+                        f.write(pickle.dumps(expiry, self.pickle_protocol))
+                        f.write(zlib.compress(pickle.dumps(value, self.pickle_protocol)))
+                        f.truncate()
+                        return value
+            except FileNotFoundError:
+                pass
+        raise ValueError(f"Key '{key}' not found")
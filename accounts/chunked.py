@@ -0,0 +1,86 @@
+import hashlib
+import os
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import ChunkedUpload
+
+
+# Bytes copied from the request stream to disk per write
+COPY_BUFFER_SIZE = 64 * 1024
+
+
+def upload_dir():
+    # Defaults to a directory inside MEDIA_ROOT so finished files can be
+    # renamed into storage without crossing filesystems
+    return getattr(settings, 'CHUNKED_UPLOAD_DIR', None) or os.path.join(settings.MEDIA_ROOT, 'partial_uploads')
+
+
+def partial_path(upload):
+    return os.path.join(upload_dir(), f"{upload.id}.part")
+
+
+def claimed_path(upload):
+    return os.path.join(upload_dir(), f"{upload.id}.finalizing")
+
+
+def claim_partial(upload):
+    """Take the finished partial file for finalizing; False if another finalize already has it.
+
+    The rename is atomic, so of several concurrent finalizes exactly one wins
+    without holding a database lock while the file is hashed and moved.
+    """
+    try:
+        os.rename(partial_path(upload), claimed_path(upload))
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def create_partial(upload):
+    os.makedirs(upload_dir(), exist_ok=True)
+    with open(partial_path(upload), 'wb'):
+        pass
+
+
+def write_chunk(upload, offset, stream, length):
+    """Copy length bytes from stream into the partial file at offset; returns bytes written"""
+    written = 0
+    with open(partial_path(upload), 'r+b') as f:
+        f.seek(offset)
+        while written < length:
+            data = stream.read(min(COPY_BUFFER_SIZE, length - written))
+            if not data:
+                break
+            f.write(data)
+            written += len(data)
+    return written
+
+
+def file_sha256(path):
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for data in iter(lambda: f.read(1024 * 1024), b''):
+            hasher.update(data)
+    return hasher.hexdigest()
+
+
+def discard(upload):
+    for path in (partial_path(upload), claimed_path(upload)):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+    upload.delete()
+
+
+def purge_stale_uploads(max_age_hours=24):
+    """Remove uploads nobody has touched for max_age_hours, with their partial files"""
+    cutoff = timezone.now() - timedelta(hours=max_age_hours)
+    count = 0
+    for upload in ChunkedUpload.objects.filter(updated_at__lt=cutoff).iterator():
+        discard(upload)
+        count += 1
+    return count
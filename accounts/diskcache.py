@@ -0,0 +1,156 @@
+import hashlib
+import os
+import tempfile
+import threading
+import time
+
+
+# Bytes this process believes each cache root holds, and when it last walked
+# the root to check: [size, walked_at]. Other processes' fills are only seen
+# on the next walk, so one happens at least every EVICT_INTERVAL seconds.
+EVICT_INTERVAL = 60
+_usage = {}
+_usage_lock = threading.Lock()
+
+
+class DiskCache:
+    """Read-through cache of remote files on local disk, evicting least recently used files.
+
+    Entries are keyed by storage name and never refreshed, which is safe because
+    paper files are never rewritten in place. Fills go through a temporary file
+    and a rename, and a lock file makes concurrent misses (in any process)
+    wait for one fetch instead of all downloading the same object.
+    """
+
+    def __init__(self, root, max_size, lock_timeout=60):
+        self.root = str(root)
+        self.max_size = max_size
+        self.lock_timeout = lock_timeout
+
+    def path(self, name):
+        digest = hashlib.sha256(name.encode()).hexdigest()
+        return os.path.join(self.root, digest[:2], digest)
+
+    def open(self, name, fetch):
+        """Open the cached copy of name, calling fetch(file) to fill it on a miss"""
+        path = self.path(name)
+        f = self._open_cached(path)
+        if f is not None:
+            return f
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        while not self._acquire(path):
+            # Another worker is fetching the same file; wait for it to land
+            time.sleep(0.05)
+            f = self._open_cached(path)
+            if f is not None:
+                return f
+
+        try:
+            f = self._open_cached(path)
+            if f is not None:
+                return f
+            self._fill(path, fetch)
+            # Opened before evicting: the descriptor survives the file being
+            # evicted, here or by another process, even when it alone is over max_size
+            f = open(path, 'rb')
+        finally:
+            self._release(path)
+
+        self._filled(os.fstat(f.fileno()).st_size)
+        return f
+
+    def discard(self, name):
+        try:
+            os.remove(self.path(name))
+        except FileNotFoundError:
+            pass
+
+    def size(self, name):
+        try:
+            return os.path.getsize(self.path(name))
+        except FileNotFoundError:
+            return None
+
+    def _filled(self, size):
+        """Count a new file and evict once the cache may be over max_size, without walking it on every miss"""
+        with _usage_lock:
+            usage = _usage.setdefault(self.root, [0, 0])
+            usage[0] += size
+            due = usage[0] > self.max_size or time.time() - usage[1] > EVICT_INTERVAL
+        if due:
+            self.evict()
+
+    def evict(self):
+        """Delete least recently used files until the cache fits in max_size"""
+        entries = []
+        total = 0
+        for directory, _, files in os.walk(self.root):
+            for filename in files:
+                if filename.endswith(('.lock', '.fill')):
+                    continue
+                path = os.path.join(directory, filename)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+        with _usage_lock:
+            _usage[self.root] = [total, time.time()]
+
+    def _open_cached(self, path):
+        try:
+            f = open(path, 'rb')
+        except FileNotFoundError:
+            return None
+        # mtime doubles as the last-used time for eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return f
+
+    def _fill(self, path, fetch):
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.fill')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                fetch(f)
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def _acquire(self, path):
+        lock = path + '.lock'
+        try:
+            os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return True
+        except FileExistsError:
+            pass
+        # A worker that died mid-fetch leaves its lock behind
+        try:
+            if time.time() - os.path.getmtime(lock) > self.lock_timeout:
+                os.remove(lock)
+        except FileNotFoundError:
+            pass
+        return False
+
+    def _release(self, path):
+        try:
+            os.remove(path + '.lock')
+        except FileNotFoundError:
+            pass
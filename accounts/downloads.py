@@ -0,0 +1,148 @@
+import hashlib
+import os
+import re
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.http import FileResponse, HttpResponse, HttpResponseRedirect
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, http_date, parse_http_date_safe, quote_etag
+from django.utils.text import slugify
+
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+class RangeFile:
+    """Read-only view of length bytes of an open file, starting at its current position"""
+
+    def __init__(self, file, length):
+        self.file = file
+        self.remaining = length
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b''
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+
+
+def paper_etag(paper, size, modified):
+    """Strong ETag for a paper file; uploaded files are never rewritten in place"""
+    if paper.blob_id:
+        return quote_etag(paper.blob.sha256)
+    digest = hashlib.sha1(f"{paper.file.name}:{size}:{modified}".encode()).hexdigest()
+    return quote_etag(digest)
+
+
+def paper_filename(paper):
+    """Download name; content-addressed files are named after the paper, not the hash"""
+    if paper.blob_id:
+        extension = os.path.splitext(paper.file.name)[1]
+        return f"{slugify(paper.title) or 'paper'}{extension}"
+    return os.path.basename(paper.file.name)
+
+
+def parse_range(header, size):
+    """(start, end) for a single 'bytes=' range, None to serve the whole file, or False if unsatisfiable"""
+    match = RANGE_RE.match(header.strip()) if header else None
+    if not match:
+        # Missing, malformed or multi-range requests get the whole file
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        length = int(last)
+        if length == 0:
+            return False
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        return False
+    return start, end
+
+
+def if_range_matches(request, etag, modified):
+    if_range = request.META.get('HTTP_IF_RANGE')
+    if not if_range:
+        return True
+    if if_range.startswith('"'):
+        return if_range == etag
+    return parse_http_date_safe(if_range) == int(modified)
+
+
+def serve_paper(request, paper, as_attachment=True):
+    """Serve a paper file with validators, conditional GET and byte-range support"""
+    storage = paper.file.storage
+    name = paper.file.name
+    if hasattr(storage, 'signed_url') and getattr(settings, 'PAPER_DOWNLOAD_SIGNED_URLS', True):
+        # Object storage: the browser downloads straight from the bucket
+        response = HttpResponseRedirect(storage.signed_url(name, paper_filename(paper), as_attachment))
+        response['Cache-Control'] = 'private, no-cache'
+        return response
+
+    size = storage.size(name)
+    modified = storage.get_modified_time(name).timestamp()
+    etag = paper_etag(paper, size, modified)
+    filename = paper_filename(paper)
+
+    response = get_conditional_response(request, etag=etag, last_modified=int(modified))
+    if response is not None:
+        return response
+
+    offload = getattr(settings, 'PAPER_DOWNLOAD_OFFLOAD', '')
+    if offload:
+        # The front end (nginx X-Accel-Redirect / Apache or lighttpd X-Sendfile)
+        # streams the bytes and handles ranges itself
+        response = HttpResponse(content_type='application/pdf')
+        if offload == 'x-accel-redirect':
+            response['X-Accel-Redirect'] = getattr(settings, 'PAPER_DOWNLOAD_ACCEL_PREFIX', '/protected-media/') + name
+        else:
+            response['X-Sendfile'] = storage.path(name)
+        response['Content-Disposition'] = content_disposition_header(as_attachment, filename)
+    else:
+        byte_range = parse_range(request.META.get('HTTP_RANGE'), size)
+        if byte_range and not if_range_matches(request, etag, modified):
+            byte_range = None
+
+        if byte_range is False:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
+
+        file = storage.open(name, 'rb')
+        if byte_range:
+            start, end = byte_range
+            file.seek(start)
+            response = FileResponse(RangeFile(file, end - start + 1), status=206, as_attachment=as_attachment, filename=filename)
+            response['Content-Range'] = f'bytes {start}-{end}/{size}'
+            response['Content-Length'] = str(end - start + 1)
+        else:
+            response = FileResponse(file, as_attachment=as_attachment, filename=filename)
+            response['Content-Length'] = str(size)
+
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(modified)
+    response['Cache-Control'] = 'private, max-age=3600'
+    return response
+
+
+def serve_thumbnail(request, name):
+    """Serve a content-hashed thumbnail; its URL changes with the file, so browsers may keep it forever"""
+    etag = quote_etag(os.path.basename(name))
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = FileResponse(default_storage.open(name, 'rb'), content_type='image/webp')
+    response['ETag'] = etag
+    # private: thumbnails are only shown to logged-in students of the college
+    response['Cache-Control'] = 'private, max-age=31536000, immutable'
+    return response
@@ -0,0 +1,218 @@
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import timedelta
+
+import django
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .listings import invalidate_listing
+from .models import PaperText, QuestionPaper
+from .thumbnails import make_thumbnail
+
+try:
+    from pypdf import PdfReader
+except ImportError:
+    PdfReader = None
+
+
+def _init_worker():
+    # Worker processes started with spawn/forkserver need Django set up to
+    # reach default_storage; they never touch the database
+    django.setup()
+
+
+def extract_pdf_text(f, max_chars):
+    """(text, page_count) of an open PDF, read page by page until max_chars of text"""
+    if PdfReader is None:
+        raise RuntimeError('pypdf is not installed')
+
+    reader = PdfReader(f)
+    parts = []
+    length = 0
+    for page in reader.pages:
+        if length >= max_chars:
+            break
+        text = ' '.join((page.extract_text() or '').split())
+        parts.append(text)
+        length += len(text) + 1
+    return ' '.join(parts)[:max_chars], len(reader.pages)
+
+
+def process_pdf(path, name, digest, max_chars):
+    """(text, page_count, thumbnail) of a PDF, opened once for both.
+
+    Runs in a worker process: path is a local file when storage has one,
+    otherwise the file is read through default_storage by name. A failed
+    thumbnail does not fail the paper; it just keeps its icon.
+    """
+    f = open(path, 'rb') if path else default_storage.open(name, 'rb')
+    with f:
+        text, page_count = extract_pdf_text(f, max_chars)
+        f.seek(0)
+        try:
+            thumbnail = make_thumbnail(f, digest)
+        except Exception as e:
+            print(f"⚠️ Thumbnail failed for {name}: {e}")
+            thumbnail = ''
+    return text, page_count, thumbnail
+
+
+def _local_path(name):
+    try:
+        return default_storage.path(name)
+    except NotImplementedError:
+        return None
+
+
+def claim_paper(paper_id):
+    """Move a pending paper to 'processing'; returns the claim's start time, None if another worker got it first"""
+    started_at = timezone.now()
+    claimed = QuestionPaper.objects.filter(pk=paper_id, text_status='pending').update(
+        text_status='processing', processing_started_at=started_at,
+    )
+    return started_at if claimed else None
+
+
+def _claimed(paper_id, started_at):
+    # The paper as this claim left it: a file replaced meanwhile puts it back
+    # to 'pending', and a reclaim gives it another start time
+    return QuestionPaper.objects.filter(pk=paper_id, text_status='processing', processing_started_at=started_at)
+
+
+def reclaim_stale_papers(stale_after=None):
+    """Queue again papers a worker claimed more than stale_after seconds ago and never finished.
+
+    A worker or pool process that crashed leaves its papers in 'processing';
+    claims from before processing_started_at existed count as stale.
+    """
+    stale_after = stale_after or getattr(settings, 'PAPER_TEXT_STALE_AFTER', 30 * 60)
+    stale_before = timezone.now() - timedelta(seconds=stale_after)
+    return QuestionPaper.objects.filter(
+        Q(processing_started_at__lt=stale_before) | Q(processing_started_at__isnull=True),
+        text_status='processing',
+    ).update(text_status='pending', processing_started_at=None)
+
+
+def save_text(paper_id, started_at, text, page_count, thumbnail=''):
+    """Store the result of the claim started at started_at; False if the claim is no longer current"""
+    with transaction.atomic():
+        if not _claimed(paper_id, started_at).update(
+            text_status='done', processing_started_at=None, page_count=page_count, thumbnail=thumbnail,
+        ):
+            return False
+        PaperText.objects.update_or_create(paper_id=paper_id, defaults={'content': text})
+        # Cached listing pages hold the paper without its page count and thumbnail
+        listing = QuestionPaper.objects.filter(pk=paper_id).values_list('college', 'branch', 'semester').first()
+        if listing:
+            transaction.on_commit(lambda: invalidate_listing(*listing))
+    return True
+
+
+def mark_failed(paper_id, started_at, error):
+    if _claimed(paper_id, started_at).update(text_status='failed', processing_started_at=None):
+        print(f"❌ Text extraction failed for paper {paper_id}: {error}")
+
+
+def copy_shared_text(paper_id, started_at, blob_id):
+    """Reuse the text and thumbnail of another paper with the same content; False if there is none yet or the claim is gone"""
+    if not blob_id:
+        return False
+    source = QuestionPaper.objects.filter(blob_id=blob_id, text_status='done').exclude(pk=paper_id).select_related('text').first()
+    if source is None or not hasattr(source, 'text'):
+        return False
+    return save_text(paper_id, started_at, source.text.content, source.page_count, source.thumbnail)
+
+
+def pending_papers(batch_size):
+    """(id, file, blob_id, sha256) of every pending paper, oldest first, fetched batch_size at a time.
+
+    sha256 is None unless the paper's file is its blob's (a file replaced in
+    admin keeps the old blob).
+    """
+    last_id = 0
+    while True:
+        batch = list(
+            QuestionPaper.objects.filter(text_status='pending', id__gt=last_id)
+            .order_by('id')
+            .values_list('id', 'file', 'blob_id', 'blob__file', 'blob__sha256')[:batch_size]
+        )
+        if not batch:
+            return
+        for paper_id, name, blob_id, blob_file, sha256 in batch:
+            yield paper_id, name, blob_id, sha256 if name == blob_file else None
+        last_id = batch[-1][0]
+
+
+def extract_pending(workers=2, batch_size=100, max_chars=None):
+    """Extract text and render thumbnails for every pending paper; returns (done, failed).
+
+    PDFs are parsed in a pool of worker processes with at most two jobs per
+    worker in flight, so memory stays bounded however large the archive is.
+    Results are written back from this process. workers=0 extracts inline.
+    Papers left in 'processing' by a crashed run are queued again first.
+    """
+    max_chars = max_chars or getattr(settings, 'PAPER_TEXT_MAX_CHARS', 100000)
+    reclaimed = reclaim_stale_papers()
+    if reclaimed:
+        print(f"⚠️ Queued {reclaimed} paper(s) again after an interrupted extraction")
+    counts = {'done': 0, 'failed': 0}
+
+    def finish(paper_id, started_at, run):
+        try:
+            text, page_count, thumbnail = run()
+        except Exception as e:
+            mark_failed(paper_id, started_at, e)
+            counts['failed'] += 1
+        else:
+            if save_text(paper_id, started_at, text, page_count, thumbnail):
+                counts['done'] += 1
+            else:
+                print(f"⚠️ Dropped text for paper {paper_id}: its file changed or it was reclaimed")
+
+    def jobs():
+        for paper_id, name, blob_id, digest in pending_papers(batch_size):
+            started_at = claim_paper(paper_id)
+            if started_at is None:
+                continue
+            if copy_shared_text(paper_id, started_at, blob_id):
+                counts['done'] += 1
+                continue
+            yield paper_id, started_at, (_local_path(name), name, digest, max_chars)
+
+    if not workers:
+        for paper_id, started_at, args in jobs():
+            finish(paper_id, started_at, lambda: process_pdf(*args))
+        return counts['done'], counts['failed']
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        in_flight = {}
+        queue = jobs()
+        exhausted = False
+        while True:
+            while not exhausted and len(in_flight) < workers * 2:
+                job = next(queue, None)
+                if job is None:
+                    exhausted = True
+                    break
+                paper_id, started_at, args = job
+                in_flight[pool.submit(process_pdf, *args)] = (paper_id, started_at)
+            if not in_flight:
+                break
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                finish(*in_flight.pop(future), future.result)
+
+    return counts['done'], counts['failed']
+
+
+def reset_text_status(statuses):
+    """Queue papers in the given statuses for extraction again"""
+    return QuestionPaper.objects.filter(text_status__in=statuses).update(text_status='pending')
+
+
+def queue_missing_thumbnails():
+    """Queue extracted papers that have no thumbnail yet (backfill)"""
+    return QuestionPaper.objects.filter(text_status='done', thumbnail='').update(text_status='pending')
@@ -0,0 +1,102 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from .cache import bump_versions, cache_version
+from .models import Internship
+from .routers import use_primary
+
+
+def _version_key(branch):
+    return f"internships_version:{branch}"
+
+
+def _cache_key(branch):
+    # Versioned, so every process's local copy goes stale on invalidation
+    return f"internships:{branch}:{cache_version(_version_key(branch))}"
+
+
+def normalize_skill(skill):
+    return ' '.join(skill.lower().split())
+
+
+def skill_tokens(skill):
+    """Index terms for a skill: the whole skill plus each part of a combined one like 'HTML/CSS'"""
+    token = normalize_skill(skill)
+    tokens = {token}
+    if '/' in token:
+        tokens.update(part.strip() for part in token.split('/') if part.strip())
+    return tokens
+
+
+def build_skill_index(internships):
+    """Inverted index from skill token to the positions of the internships listing it"""
+    index = {}
+    for position, internship in enumerate(internships):
+        for skill in internship['skills']:
+            for token in skill_tokens(skill):
+                index.setdefault(token, set()).add(position)
+    return index
+
+
+def get_catalog(branch):
+    """Active internships for a student branch, newest first, with their skill index.
+
+    Both are cached together until the catalog changes, so a skill search is a
+    handful of set operations on the cached index.
+    """
+    key = _cache_key(branch)
+    catalog = cache.get(key)
+    if catalog is None:
+        # Refills follow invalidations, so read them from the primary
+        with use_primary():
+            rows = list(
+                Internship.objects.filter(
+                    branch__in=Internship.listing_branches(branch),
+                    is_active=True,
+                )
+            )
+        internships = [
+            {
+                'company_name': internship.company_name,
+                'role': internship.role,
+                'logo_initials': internship.logo_initials,
+                'location': internship.location,
+                'duration': internship.duration,
+                'description': internship.description,
+                'skills': internship.get_skills_list(),
+                'apply_link': internship.apply_link,
+            }
+            for internship in rows
+        ]
+        catalog = {
+            'internships': internships,
+            'skill_index': build_skill_index(internships),
+            'skill_names': sorted({skill for internship in internships for skill in internship['skills']}, key=str.lower),
+        }
+        cache.set(key, catalog, getattr(settings, 'INTERNSHIP_CACHE_TIMEOUT', 24 * 60 * 60))
+    return catalog
+
+
+def search_internships(catalog, skills, match='any'):
+    """Internships of a catalog having any (or, with match='all', every) one of the skills"""
+    tokens = {normalize_skill(skill) for skill in skills if skill.strip()}
+    if not tokens:
+        return catalog['internships']
+
+    postings = [catalog['skill_index'].get(token, set()) for token in tokens]
+    if match == 'all':
+        positions = set.intersection(*postings)
+    else:
+        positions = set().union(*postings)
+    return [catalog['internships'][position] for position in sorted(positions)]
+
+
+def invalidate_internships(*internship_branches):
+    """Drop cached listings showing internships of the given Internship.branch values"""
+    keys = set()
+    for internship_branch in internship_branches:
+        if internship_branch == 'both':
+            keys.update(_version_key(branch) for branch in ('cse', 'ist'))
+        else:
+            keys.add(_version_key(internship_branch))
+    bump_versions(*keys)
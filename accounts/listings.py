@@ -0,0 +1,38 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from .cache import bump_versions, cache_version
+from .models import QuestionPaper
+from .pagination import keyset_page
+from .routers import use_primary
+
+
+def _version_key(college, branch, semester):
+    return f"paper_listing_version:{college}:{branch}:{semester}"
+
+
+def listing_version(college, branch, semester):
+    """Current version token for a (college, branch, semester) listing"""
+    return cache_version(_version_key(college, branch, semester))
+
+
+def invalidate_listing(college, branch, semester):
+    """Drop every cached page of a listing by moving it to a new version"""
+    bump_versions(_version_key(college, branch, semester))
+
+
+def get_paper_page(college, branch, semester, doc_type=None, after=None, before=None, page_size=20):
+    """Keyset page of a listing, served from cache between uploads"""
+    version = listing_version(college, branch, semester)
+    key = f"paper_listing:{college}:{branch}:{semester}:{version}:{doc_type or ''}:{after or ''}:{before or ''}:{page_size}"
+    page = cache.get(key)
+    if page is None:
+        # From the primary, or a lagging replica could cache a page from
+        # before the upload that moved the version
+        with use_primary():
+            papers = QuestionPaper.objects.filter(branch=branch, semester=semester, college=college)
+            if doc_type:
+                papers = papers.filter(doc_type=doc_type)
+            page = keyset_page(papers, after=after, before=before, page_size=page_size)
+        cache.set(key, page, getattr(settings, 'PAPER_LISTING_CACHE_TIMEOUT', 3600))
+    return page
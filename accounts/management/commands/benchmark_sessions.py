@@ -0,0 +1,80 @@
+import time
+from importlib import import_module
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from accounts.subscriptions import forget_email
+
+
+ENGINES = {
+    'db': 'django.contrib.sessions.backends.db',
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'signed_cookies': 'django.contrib.sessions.backends.signed_cookies',
+}
+
+BENCHMARK_EMAIL = 'session-benchmark@example.invalid'
+
+
+def navigation_chain(college, branch, semester):
+    """The student flow after OTP login, from picking a college to the paper listing"""
+    return [
+        reverse('student_select_college', kwargs={'college': college}),
+        reverse('branch_selection'),
+        reverse('semester_selection', kwargs={'branch': branch}),
+        reverse('view_notes', kwargs={'branch': branch, 'semester': semester}),
+    ]
+
+
+def run_chain(engine, urls, rounds):
+    """(session queries, total queries, seconds) per request, averaged over rounds of the chain"""
+    with override_settings(SESSION_ENGINE=engine, ALLOWED_HOSTS=['testserver']):
+        store = import_module(engine).SessionStore()
+        store.update({'authenticated': True, 'user_email': BENCHMARK_EMAIL})
+        store.save()
+        client = Client()
+        client.cookies[settings.SESSION_COOKIE_NAME] = store.session_key
+
+        session_queries = total_queries = 0
+        started = time.perf_counter()
+        for _ in range(rounds):
+            for url in urls:
+                with CaptureQueriesContext(connection) as queries:
+                    client.get(url)
+                total_queries += len(queries)
+                session_queries += sum('django_session' in query['sql'] for query in queries.captured_queries)
+        elapsed = time.perf_counter() - started
+
+        session_key = client.cookies[settings.SESSION_COOKIE_NAME].value
+        import_module(engine).SessionStore(session_key).delete()
+
+    requests = rounds * len(urls)
+    return session_queries / requests, total_queries / requests, elapsed / requests
+
+
+class Command(BaseCommand):
+    help = 'Compare per-request queries and latency of session engines over the student navigation chain'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rounds', type=int, default=50, help='Times the navigation chain is walked per engine')
+        parser.add_argument('--engine', action='append', choices=sorted(ENGINES), help='Engine to measure (default: all)')
+        parser.add_argument('--college', default='meip')
+        parser.add_argument('--branch', default='cse')
+        parser.add_argument('--semester', default='3')
+
+    def handle(self, *args, **options):
+        urls = navigation_chain(options['college'], options['branch'], options['semester'])
+        self.stdout.write(f"{options['rounds']} x {len(urls)} requests per engine, current engine {settings.SESSION_ENGINE}")
+        self.stdout.write(f"{'engine':<16}{'session q/req':>15}{'total q/req':>13}{'ms/req':>10}")
+
+        for name in options['engine'] or ENGINES:
+            # Everything the chain writes is rolled back
+            with transaction.atomic():
+                session_queries, total_queries, seconds = run_chain(ENGINES[name], urls, options['rounds'])
+                transaction.set_rollback(True)
+            forget_email(BENCHMARK_EMAIL)
+            self.stdout.write(f"{name:<16}{session_queries:>15.2f}{total_queries:>13.2f}{seconds * 1000:>10.2f}")
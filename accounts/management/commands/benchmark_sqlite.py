@@ -0,0 +1,157 @@
+import multiprocessing
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+
+COLLEGES = ['meip', 'pvp', 'sjp', 'rrp']
+BRANCHES = ['cse', 'civil', 'mech', 'eee']
+SEMESTERS = ['1', '2', '3', '4', '5', '6']
+
+
+def sqlite_profiles():
+    """Connection setups compared: Django's SQLite defaults and this project's settings"""
+    options = {}
+    if settings.DATABASES['default']['ENGINE'] == 'django.db.backends.sqlite3':
+        options = settings.DATABASES['default'].get('OPTIONS', {})
+    return {
+        'default': {'pragmas': [], 'transaction_mode': 'DEFERRED', 'timeout': 5},
+        'tuned': {
+            'pragmas': [pragma.strip() for pragma in options.get('init_command', '').split(';') if pragma.strip()]
+            or [f'PRAGMA {pragma}' for pragma in getattr(settings, 'SQLITE_PRAGMAS', [])],
+            'transaction_mode': options.get('transaction_mode') or 'IMMEDIATE',
+            'timeout': options.get('timeout', 20),
+        },
+    }
+
+
+def connect(path, profile):
+    # Autocommit with explicit BEGIN, as Django's backend does
+    conn = sqlite3.connect(path, timeout=profile['timeout'], isolation_level=None)
+    for pragma in profile['pragmas']:
+        conn.execute(pragma)
+    return conn
+
+
+def create_database(path, papers):
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.executescript('''
+        CREATE TABLE paper (id INTEGER PRIMARY KEY, college TEXT, branch TEXT, semester TEXT, title TEXT, uploaded_at REAL);
+        CREATE INDEX paper_listing ON paper (college, branch, semester, uploaded_at DESC, id DESC);
+        CREATE TABLE subscription (email TEXT, college TEXT, branch TEXT, semester TEXT, last_viewed REAL);
+        CREATE UNIQUE INDEX subscription_key ON subscription (email, college, branch, semester);
+    ''')
+    conn.executemany(
+        'INSERT INTO paper (college, branch, semester, title, uploaded_at) VALUES (?, ?, ?, ?, ?)',
+        [
+            (random.choice(COLLEGES), random.choice(BRANCHES), random.choice(SEMESTERS), f'Paper {number}', time.time() - number)
+            for number in range(papers)
+        ],
+    )
+    conn.close()
+
+
+def read_listing(conn):
+    conn.execute(
+        'SELECT id, title FROM paper WHERE college = ? AND branch = ? AND semester = ? '
+        'ORDER BY uploaded_at DESC, id DESC LIMIT 20',
+        (random.choice(COLLEGES), random.choice(BRANCHES), random.choice(SEMESTERS)),
+    ).fetchall()
+
+
+def upsert_subscription(conn, transaction_mode):
+    # Read then write in one transaction, like get_or_create in view_notes_view
+    key = (f'student{random.randrange(500)}@example.com', random.choice(COLLEGES), random.choice(BRANCHES), random.choice(SEMESTERS))
+    conn.execute(f'BEGIN {transaction_mode}')
+    try:
+        found = conn.execute(
+            'SELECT 1 FROM subscription WHERE email = ? AND college = ? AND branch = ? AND semester = ?', key
+        ).fetchone()
+        if found:
+            conn.execute(
+                'UPDATE subscription SET last_viewed = ? WHERE email = ? AND college = ? AND branch = ? AND semester = ?',
+                (time.time(), *key),
+            )
+        else:
+            conn.execute('INSERT INTO subscription VALUES (?, ?, ?, ?, ?)', (*key, time.time()))
+        conn.execute('COMMIT')
+    except BaseException:
+        conn.execute('ROLLBACK')
+        raise
+
+
+def run_worker(path, profile, write_ratio, start, deadline, results):
+    """One gunicorn-like worker: its own connection doing a mix of listing reads and upserts"""
+    conn = connect(path, profile)
+    reads = writes = errors = 0
+    while time.time() < start:
+        time.sleep(0.001)
+    while time.time() < deadline:
+        try:
+            if random.random() < write_ratio:
+                upsert_subscription(conn, profile['transaction_mode'])
+                writes += 1
+            else:
+                read_listing(conn)
+                reads += 1
+        except sqlite3.OperationalError:
+            # "database is locked": what a request would have failed with
+            errors += 1
+    conn.close()
+    results.put((reads, writes, errors))
+
+
+def run_profile(profile, workers, seconds, write_ratio, papers):
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'benchmark.sqlite3')
+    try:
+        create_database(path, papers)
+        # Journal mode sticks to the file, so set it before workers connect
+        connect(path, profile).close()
+
+        results = multiprocessing.Queue()
+        start = time.time() + 0.5
+        processes = [
+            multiprocessing.Process(target=run_worker, args=(path, profile, write_ratio, start, start + seconds, results))
+            for _ in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        totals = [sum(values) for values in zip(*(results.get() for _ in processes))]
+        for process in processes:
+            process.join()
+        return totals
+    finally:
+        for filename in os.listdir(directory):
+            os.remove(os.path.join(directory, filename))
+        os.rmdir(directory)
+
+
+class Command(BaseCommand):
+    help = 'Measure SQLite throughput under concurrent reads and writes with default and tuned connection settings'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=8, help='Concurrent processes, like gunicorn workers')
+        parser.add_argument('--seconds', type=float, default=5.0, help='Duration of each run')
+        parser.add_argument('--write-ratio', type=float, default=0.2, help='Share of operations that write')
+        parser.add_argument('--papers', type=int, default=5000, help='Rows in the scratch paper table')
+        parser.add_argument('--profile', action='append', choices=['default', 'tuned'], help='Profile to run (default: both)')
+
+    def handle(self, *args, **options):
+        profiles = sqlite_profiles()
+        self.stdout.write(
+            f"{options['workers']} workers, {options['seconds']}s, "
+            f"{options['write_ratio']:.0%} writes on a scratch database"
+        )
+        self.stdout.write(f"{'profile':<10}{'reads/s':>10}{'writes/s':>10}{'errors':>8}")
+        for name in options['profile'] or profiles:
+            reads, writes, errors = run_profile(
+                profiles[name], options['workers'], options['seconds'], options['write_ratio'], options['papers']
+            )
+            seconds = options['seconds']
+            self.stdout.write(f"{name:<10}{reads / seconds:>10.0f}{writes / seconds:>10.0f}{errors:>8}")
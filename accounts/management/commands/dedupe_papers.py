@@ -0,0 +1,50 @@
+import hashlib
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from accounts.blobs import store_upload
+from accounts.models import QuestionPaper
+
+
+class Command(BaseCommand):
+    help = 'Move papers uploaded before content addressing onto shared SHA-256 blobs'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Only report what would be deduplicated')
+
+    def handle(self, *args, **options):
+        moved = missing = 0
+        seen = set()
+        duplicates = 0
+
+        for paper in QuestionPaper.objects.filter(blob__isnull=True).exclude(file='').iterator():
+            storage = paper.file.storage
+            old_name = paper.file.name
+            if not storage.exists(old_name):
+                missing += 1
+                continue
+
+            hasher = hashlib.sha256()
+            with storage.open(old_name, 'rb') as f:
+                for chunk in f.chunks():
+                    hasher.update(chunk)
+            digest = hasher.hexdigest()
+            duplicates += digest in seen
+            seen.add(digest)
+
+            if options['dry_run']:
+                continue
+
+            with transaction.atomic():
+                with storage.open(old_name, 'rb') as f:
+                    blob = store_upload(f, digest)
+                QuestionPaper.objects.filter(pk=paper.pk).update(file=blob.file.name, blob=blob)
+
+            if not QuestionPaper.objects.filter(file=old_name).exists():
+                storage.delete(old_name)
+            moved += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{moved} paper(s) moved to blobs, {duplicates} duplicate(s) found, {missing} missing file(s)'
+        ))
@@ -0,0 +1,49 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from accounts.extraction import extract_pending, queue_missing_thumbnails, reset_text_status
+
+
+class Command(BaseCommand):
+    help = 'Extract text, page counts and first-page thumbnails from uploaded PDFs'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=2, help='Extraction processes (0 extracts in this process)')
+        parser.add_argument('--batch-size', type=int, default=100, help='Pending papers fetched per query')
+        parser.add_argument('--sleep', type=float, default=10.0, help='Seconds to wait when nothing is pending')
+        parser.add_argument('--once', action='store_true', help='Process everything pending and exit (backfill)')
+        parser.add_argument('--retry-failed', action='store_true', help='Queue failed and interrupted papers again first')
+        parser.add_argument('--all', action='store_true', help='Queue every paper again first')
+        parser.add_argument('--missing-thumbnails', action='store_true', help='Queue extracted papers without a thumbnail first')
+
+    def handle(self, *args, **options):
+        if options['all']:
+            queued = reset_text_status(['processing', 'done', 'failed'])
+            self.stdout.write(f'{queued} paper(s) queued for extraction')
+        elif options['retry_failed']:
+            queued = reset_text_status(['processing', 'failed'])
+            self.stdout.write(f'{queued} paper(s) queued for extraction')
+        if options['missing_thumbnails']:
+            queued = queue_missing_thumbnails()
+            self.stdout.write(f'{queued} paper(s) queued for thumbnails')
+
+        done = failed = 0
+        try:
+            while True:
+                close_old_connections()
+                batch_done, batch_failed = extract_pending(
+                    workers=options['workers'],
+                    batch_size=options['batch_size'],
+                )
+                done += batch_done
+                failed += batch_failed
+                if options['once']:
+                    break
+                if not (batch_done or batch_failed):
+                    time.sleep(options['sleep'])
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS(f'{done} paper(s) extracted, {failed} failed'))
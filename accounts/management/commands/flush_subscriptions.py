@@ -0,0 +1,28 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from accounts.subscriptions import flush_subscriptions
+
+
+class Command(BaseCommand):
+    help = 'Write subscriptions buffered by view_notes to the database'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sleep', type=float, default=30.0, help='Seconds between flushes')
+        parser.add_argument('--once', action='store_true', help='Flush once and exit instead of polling')
+
+    def handle(self, *args, **options):
+        flushed = 0
+        try:
+            while True:
+                close_old_connections()
+                flushed += flush_subscriptions()
+                if options['once']:
+                    break
+                time.sleep(options['sleep'])
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS(f'Flushed {flushed} subscription(s)'))
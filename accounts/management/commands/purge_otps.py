@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from accounts.otp import purge_otps
+
+
+class Command(BaseCommand):
+    help = 'Delete verified and expired login OTPs'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows deleted per query')
+
+    def handle(self, *args, **options):
+        count = purge_otps(options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'{count} OTP(s) purged'))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from accounts.blobs import purge_unreferenced_blobs
+from accounts.chunked import purge_stale_uploads
+
+
+class Command(BaseCommand):
+    help = 'Delete chunked uploads that were abandoned before being finalized, and blob files nothing refers to'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--max-age-hours', type=int, default=24, help='Age since the last chunk after which an upload is abandoned')
+
+    def handle(self, *args, **options):
+        count = purge_stale_uploads(options['max_age_hours'])
+        self.stdout.write(self.style.SUCCESS(f'{count} stale upload(s) removed'))
+        count = purge_unreferenced_blobs(options['max_age_hours'])
+        self.stdout.write(self.style.SUCCESS(f'{count} unreferenced blob(s) removed'))
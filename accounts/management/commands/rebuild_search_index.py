@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from accounts.search import install_search_index, remove_search_index
+
+
+class Command(BaseCommand):
+    help = 'Recreate the paper full-text index (and its SQLite triggers) from the papers table'
+
+    def handle(self, *args, **options):
+        with connection.schema_editor() as schema_editor:
+            remove_search_index(schema_editor)
+            install_search_index(schema_editor)
+        self.stdout.write(self.style.SUCCESS(f'Search index rebuilt for {connection.vendor}'))
@@ -0,0 +1,60 @@
+import os
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connections
+
+from accounts.notifications import process_outbox
+
+
+class Command(BaseCommand):
+    help = 'Deliver queued upload notifications from the notification outbox'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=20, help='Outbox entries claimed per batch')
+        parser.add_argument('--workers', type=int, default=1, help='Worker threads in this process')
+        parser.add_argument('--sleep', type=float, default=5.0, help='Seconds to wait when the outbox is empty')
+        parser.add_argument('--max-attempts', type=int, default=5, help='Delivery attempts before an entry is marked failed')
+        parser.add_argument('--stale-after', type=int, default=600, help='Seconds before a claimed entry can be reclaimed')
+        parser.add_argument('--once', action='store_true', help='Drain the outbox and exit instead of polling')
+
+    def handle(self, *args, **options):
+        self.stop = threading.Event()
+        workers = max(1, options['workers'])
+        prefix = f"{socket.gethostname()}-{os.getpid()}"
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(self.run_worker, f"{prefix}-{i}", options)
+                for i in range(workers)
+            ]
+            try:
+                handled = sum(future.result() for future in futures)
+            except KeyboardInterrupt:
+                self.stop.set()
+                handled = sum(future.result() for future in futures)
+
+        self.stdout.write(self.style.SUCCESS(f'Processed {handled} notification(s)'))
+
+    def run_worker(self, worker_id, options):
+        handled = 0
+        try:
+            while not self.stop.is_set():
+                close_old_connections()
+                count = process_outbox(
+                    batch_size=options['batch_size'],
+                    worker_id=worker_id,
+                    max_attempts=options['max_attempts'],
+                    stale_after=options['stale_after'],
+                )
+                handled += count
+                if count:
+                    continue
+                if options['once']:
+                    break
+                self.stop.wait(options['sleep'])
+        finally:
+            connections.close_all()
+        return handled
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.9 on 2026-10-17 17:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0009_notificationoutbox'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='questionpaper',
+            index=models.Index(fields=['college', 'branch', 'semester', '-uploaded_at'], name='paper_listing_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='questionpaper',
+            index=models.Index(fields=['college', 'branch', 'uploaded_by', '-uploaded_at'], name='paper_uploader_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='studentnotification',
+            index=models.Index(fields=['college', 'branch', 'semester', 'wants_notifications', 'email'], name='notification_fanout_idx'),
+        ),
+    ]
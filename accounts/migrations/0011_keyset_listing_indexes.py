@@ -0,0 +1,25 @@
+# Generated by Django 5.2.9 on 2026-10-17 17:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0010_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='questionpaper',
+            name='paper_listing_idx',
+        ),
+        migrations.AddIndex(
+            model_name='questionpaper',
+            index=models.Index(fields=['college', 'branch', 'semester', '-uploaded_at', '-id'], name='paper_listing_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='questionpaper',
+            index=models.Index(fields=['college', 'branch', 'semester', 'doc_type', '-uploaded_at', '-id'], name='paper_doc_type_idx'),
+        ),
+    ]
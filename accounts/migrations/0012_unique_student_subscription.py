@@ -0,0 +1,32 @@
+# Generated by Django 5.2.9 on 2026-10-17 17:50
+
+from django.db import migrations, models
+
+
+def remove_duplicate_subscriptions(apps, schema_editor):
+    StudentNotification = apps.get_model('accounts', 'StudentNotification')
+    duplicates = (
+        StudentNotification.objects
+        .values('email', 'college', 'branch', 'semester')
+        .annotate(keep=models.Max('id'), count=models.Count('id'))
+        .filter(count__gt=1)
+    )
+    for row in duplicates:
+        StudentNotification.objects.filter(
+            email=row['email'], college=row['college'], branch=row['branch'], semester=row['semester'],
+        ).exclude(id=row['keep']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0011_keyset_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_subscriptions, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='studentnotification',
+            constraint=models.UniqueConstraint(fields=('email', 'college', 'branch', 'semester'), name='unique_student_subscription'),
+        ),
+    ]
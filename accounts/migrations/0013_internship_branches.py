@@ -0,0 +1,22 @@
+# Generated by Django 5.2.9 on 2026-10-17 17:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0012_unique_student_subscription'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='internship',
+            name='branch',
+            field=models.CharField(choices=[('cse', 'Computer Science & Engineering'), ('ist', 'Information Science & Technology'), ('both', 'Both CSE & ISE'), ('mech', 'Mechanical Engineering'), ('civil', 'Civil Engineering'), ('eee', 'Electrical & Electronics Engineering'), ('ece', 'Electronics & Communication Engineering'), ('auto', 'Automobile Engineering'), ('ice', 'Instrumentation & Control Engineering')], max_length=10),
+        ),
+        migrations.AddIndex(
+            model_name='internship',
+            index=models.Index(fields=['branch', 'is_active', '-posted_date'], name='internship_listing_idx'),
+        ),
+    ]
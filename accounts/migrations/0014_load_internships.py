@@ -0,0 +1,767 @@
+# Loads the internship catalog that used to be hard-coded in internships_view
+
+from datetime import timedelta
+
+from django.db import migrations
+from django.utils import timezone
+
+
+INTERNSHIPS = {
+    'both': [
+        {
+            'company_name': 'Scontinent Technology',
+            'role': 'Full Stack Developer Intern',
+            'logo_initials': 'SC',
+            'location': 'Bangalore (Hybrid)',
+            'duration': '6 Months',
+            'description': 'Work on real-world projects using Python, Django, and React',
+            'skills': 'Python, Django, React, SQL',
+            'apply_link': 'https://scontinent.com',
+        },
+        {
+            'company_name': 'KaaShiv Infotech',
+            'role': 'Software Development Intern',
+            'logo_initials': 'KI',
+            'location': 'Chennai (On-site)',
+            'duration': '3-6 Months',
+            'description': 'Learn software development with hands-on training',
+            'skills': 'Java, PHP, Web Development',
+            'apply_link': 'https://www.kaashivinfotech.com',
+        },
+        {
+            'company_name': 'ThinkNEXT Technologies',
+            'role': 'Web Development Intern',
+            'logo_initials': 'TN',
+            'location': 'Chandigarh/Online',
+            'duration': '1-6 Months',
+            'description': 'Learn modern web technologies',
+            'skills': 'HTML/CSS, JavaScript, PHP',
+            'apply_link': 'https://www.thinknexttraining.com',
+        },
+        {
+            'company_name': 'Internshala',
+            'role': 'Various Tech Internships',
+            'logo_initials': 'IS',
+            'location': 'Multiple Locations/Remote',
+            'duration': 'Varies',
+            'description': 'Platform with 800+ internships for diploma students',
+            'skills': 'Multiple Skills, Remote Options',
+            'apply_link': 'https://internshala.com',
+        },
+        {
+            'company_name': 'InternshipWala',
+            'role': 'CSE Online Internships',
+            'logo_initials': 'IW',
+            'location': 'Online/Remote',
+            'duration': '2-3 Months',
+            'description': 'Online certificate programs in various tech domains',
+            'skills': 'Python, Data Science, Cyber Security',
+            'apply_link': 'https://www.internshipwala.com',
+        },
+        {
+            'company_name': 'Innovians Technologies',
+            'role': 'Summer Internship Program',
+            'logo_initials': 'IT',
+            'location': 'Multiple Cities/Online',
+            'duration': '2-8 Weeks',
+            'description': 'Hands-on training in emerging technologies',
+            'skills': 'IoT, Machine Learning, Web Dev',
+            'apply_link': 'https://innovianstechnologies.com',
+        },
+        {
+            'company_name': 'Optimspace.in',
+            'role': 'Data Science Intern',
+            'logo_initials': 'OP',
+            'location': 'Remote',
+            'duration': '3 Months',
+            'description': 'Learn data science and AI fundamentals',
+            'skills': 'Data Science, AI, Python',
+            'apply_link': 'https://optimspace.in',
+        },
+        {
+            'company_name': 'Wellorgs Infotech',
+            'role': 'Computer Vision Intern',
+            'logo_initials': 'WI',
+            'location': 'Bangalore (Hybrid)',
+            'duration': '3-6 Months',
+            'description': 'Work on computer vision and image processing projects',
+            'skills': 'Computer Vision, OpenCV, Python',
+            'apply_link': 'https://wellorgs.com/',
+        },
+        {
+            'company_name': 'Quaere e-Technologies',
+            'role': 'Software Development Intern',
+            'logo_initials': 'QE',
+            'location': 'Hyderabad (On-site)',
+            'duration': '6 Months',
+            'description': 'Full-stack development training program',
+            'skills': 'Java, SQL, Cloud',
+            'apply_link': 'https://www.quaeretech.com/Careers',
+        },
+        {
+            'company_name': 'DIPC Tech',
+            'role': 'IoT Development Intern',
+            'logo_initials': 'DT',
+            'location': 'Pune (On-site)',
+            'duration': '3-6 Months',
+            'description': 'Learn IoT development with hands-on projects',
+            'skills': 'Arduino, Raspberry Pi, C++',
+            'apply_link': 'https://dipc.tech/',
+        },
+    ],
+    'mech': [
+        {
+            'company_name': 'ThinkNEXT Technologies',
+            'role': 'Mechanical Engineering Intern',
+            'logo_initials': 'TN',
+            'location': 'Online/Offline',
+            'duration': '1-6 Months',
+            'description': 'Mechanical engineering internships (CAD/CAM, CNC programming, HVAC, Design)',
+            'skills': 'CAD/CAM, CNC, HVAC, Design',
+            'apply_link': 'https://www.thinknexttraining.com',
+        },
+        {
+            'company_name': 'Igeeks Technologies',
+            'role': 'Mechanical Internship',
+            'logo_initials': 'IG',
+            'location': 'Offline/Onsite',
+            'duration': 'Varies',
+            'description': 'Hands-on practical internship for CAD, modelling, design work',
+            'skills': 'CAD, Modelling, Design',
+            'apply_link': 'https://igeekstechnologies.com/',
+        },
+        {
+            'company_name': 'SMEClabs',
+            'role': 'Mechanical Engineering Training',
+            'logo_initials': 'SM',
+            'location': 'Offline',
+            'duration': 'Short/Long term',
+            'description': 'Training programs for Engineering, Diploma, Degree students',
+            'skills': 'Manufacturing, Design, Analysis',
+            'apply_link': 'https://www.smeclabs.com/',
+        },
+        {
+            'company_name': 'Emertxe',
+            'role': 'Embedded Systems Intern',
+            'logo_initials': 'EM',
+            'location': 'Online',
+            'duration': 'Varies',
+            'description': 'Embedded Systems / IoT internships for mechanical students',
+            'skills': 'Embedded Systems, IoT, Automation',
+            'apply_link': 'https://www.emertxe.com/',
+        },
+        {
+            'company_name': 'NTTF',
+            'role': 'Manufacturing & Mechatronics Intern',
+            'logo_initials': 'NT',
+            'location': 'Offline/Workshop',
+            'duration': '4 Weeks',
+            'description': 'CADD, CNC, Mechatronics, Automation, 3D printing programs',
+            'skills': 'CNC, Mechatronics, 3D Printing',
+            'apply_link': 'https://nttftrg.com/',
+        },
+        {
+            'company_name': 'KaaShiv Infotech',
+            'role': 'Mechanical/Diploma Internship',
+            'logo_initials': 'KI',
+            'location': 'Online/Offline',
+            'duration': 'Varies',
+            'description': 'Project-based internships with reports and certificates',
+            'skills': 'CAD, Analysis, Projects',
+            'apply_link': 'https://www.kaashivinfotech.com',
+        },
+        {
+            'company_name': 'Skill-Lync',
+            'role': 'CAD/CAE Training',
+            'logo_initials': 'SL',
+            'location': 'Online',
+            'duration': '2-6 Months',
+            'description': 'Industry-oriented CAD, CAE, and CFD training',
+            'skills': 'CAD, CAE, CFD, ANSYS',
+            'apply_link': 'https://skill-lync.com/',
+        },
+        {
+            'company_name': 'CADD Centre',
+            'role': 'Design & Drafting Intern',
+            'logo_initials': 'CC',
+            'location': 'Multiple Cities',
+            'duration': '3-6 Months',
+            'description': 'AutoCAD, SolidWorks, and manufacturing design training',
+            'skills': 'AutoCAD, SolidWorks, CATIA',
+            'apply_link': 'https://caddcentre.com/',
+        },
+        {
+            'company_name': 'TATA Technologies',
+            'role': 'Product Design Intern',
+            'logo_initials': 'TT',
+            'location': 'Pune/Bangalore',
+            'duration': '6 Months',
+            'description': 'Work on automotive and aerospace design projects',
+            'skills': 'Product Design, CAD, Simulation',
+            'apply_link': 'https://www.tata.com/careers/programs/tata-global-internships/apply-here',
+        },
+        {
+            'company_name': 'L&T Construction',
+            'role': 'Site Engineering Intern',
+            'logo_initials': 'LT',
+            'location': 'Various Sites',
+            'duration': '3-6 Months',
+            'description': 'On-site mechanical engineering and construction management',
+            'skills': 'Construction, Project Management, MEP',
+            'apply_link': 'https://www.lntecc.com/',
+        },
+    ],
+    'civil': [
+        {
+            'company_name': 'ThinkNEXT Technologies',
+            'role': 'Civil Engineering Intern',
+            'logo_initials': 'TN',
+            'location': 'Online/Offline',
+            'duration': '1-6 Months',
+            'description': 'Hands-on civil engineering internship — project support, field basics, documentation, CAD drafting & site exposure.',
+            'skills': 'AutoCAD, Site Surveying, Construction Planning, Quantity Estimation, BOQ Preparation',
+            'apply_link': 'https://www.thinknexttraining.com/Internship-in-civil-engineering-students.aspx',
+        },
+        {
+            'company_name': 'CivilEra',
+            'role': 'Civil Engineering Intern',
+            'logo_initials': 'CE',
+            'location': 'Online/Offline',
+            'duration': '1-6 Months',
+            'description': 'Internship with real projects in structural & civil works, including software training & project reporting. Covers construction methodologies and design basics. Offers certificates.',
+            'skills': 'ETABS, STAAD Pro, Safe, Revit Structures, AutoCAD, Project Management',
+            'apply_link': 'https://www.civilera.com/interns',
+        },
+        {
+            'company_name': 'Internshala',
+            'role': 'Civil Engineering Intern',
+            'logo_initials': 'IH',
+            'location': 'Online/Offline (varies by posting)',
+            'duration': '1-6 Months',
+            'description': 'Platform aggregating civil internships across Bengaluru. Roles involve site assistance, drafting, estimation, CAD modelling, reporting.',
+            'skills': 'AutoCAD, Site Assistance, Quantity Surveying, MS Excel, Report Writing',
+            'apply_link': 'https://internshala.com/internships/civil-internship-in-bangalore',
+        },
+        {
+            'company_name': 'Sanfoundry',
+            'role': 'Civil Engineering Intern',
+            'logo_initials': 'SF',
+            'location': 'Work From Home / Office Bangalore',
+            'duration': '1-3 Months',
+            'description': 'Remote or office internships including civil engineering project contributions, learning and documentation tasks.',
+            'skills': 'Technical Writing, Civil Concepts, Problem Solving, Project Research',
+            'apply_link': 'https://www.sanfoundry.com/internship/',
+        },
+        {
+            'company_name': 'Practice School (via practiceschool.in)',
+            'role': 'Civil Engineering Intern',
+            'logo_initials': 'PS',
+            'location': 'Online/Offline',
+            'duration': '1-6 Months',
+            'description': 'Internships with flexible options including AutoCAD & STAAD Pro, construction exposure, field planning, and certification support.',
+            'skills': 'AutoCAD, STAAD Pro, Site Monitoring, Construction Methods, Team Collaboration',
+            'apply_link': 'https://practiceschool.in/engineering-in-civil/',
+        },
+        {
+            'company_name': 'Local Construction/Consultancy Firms (via Internshala/LinkedIn)',
+            'role': 'Civil Engineering Intern',
+            'logo_initials': 'LC',
+            'location': 'Offline',
+            'duration': '1-6 Months',
+            'description': 'Internship with Bangalore-based contractors & consultants (site work, supervision, documentation, quantity surveying). Apply via listings.',
+            'skills': 'Site Supervision, Material Testing, Surveying, Concrete & Soil Basics, Field Reports',
+            'apply_link': 'https://internshala.com/internships/civil-internship-in-bangalore',
+        },
+        {
+            'company_name': 'Burns & McDonnell India',
+            'role': 'Civil Trainee Engineer / Intern',
+            'logo_initials': 'BM',
+            'location': 'Offline (Bengaluru)',
+            'duration': '3-6 Months',
+            'description': 'Trainee internship focusing on drafting, design calculations, construction documentation under a well-known engineering firm. (Civil roles appear on listings.)',
+            'skills': 'Civil Drafting, Documentation, Structural Basics, Revit/AutoCAD, Team Coordination',
+            'apply_link': 'https://www.glassdoor.co.in/Job/bangalore-civil-engineering-internship-jobs-SRCH_IL.0,9_IM1091_KO10,38.htm',
+        },
+        {
+            'company_name': 'LinkedIn Civil Intern Roles (Various Employers)',
+            'role': 'Civil Engineering Intern',
+            'logo_initials': 'LI',
+            'location': 'Offline/Hybrid (varies)',
+            'duration': '1-6 Months',
+            'description': 'Multiple civil internships in Bangalore listed by employers on LinkedIn (site assistant, design support, surveying). You can apply directly via LinkedIn.',
+            'skills': 'AutoCAD, Site Coordination, MS Excel, Basic Design, Reporting',
+            'apply_link': 'https://www.linkedin.com/jobs/civil-engineering-intern-jobs-bengaluru',
+        },
+        {
+            'company_name': 'InternshipWala (Civil Internships)',
+            'role': 'Civil Engineering Intern',
+            'logo_initials': 'IW',
+            'location': 'Online/Offline',
+            'duration': '1-8 Weeks (varies)',
+            'description': 'Civil internships in areas like roads & highways, building construction, STAAD Pro & AutoCAD work; often online projects & reports.',
+            'skills': 'AutoCAD, STAAD Pro, Roads & Highways Concepts, Construction Workflow, Reporting',
+            'apply_link': 'https://www.internshipwala.com/CivilEngineering-Internship',
+        },
+    ],
+    'eee': [
+        {
+            'company_name': 'ThinkNEXT Technologies',
+            'role': 'Electrical & Electronics Engineering Intern',
+            'logo_initials': 'TN',
+            'location': 'Online/Offline',
+            'duration': '1-6 Months',
+            'description': 'Internship for EEE/ECE students covering industrial automation, power systems, embedded systems, PLC/SCADA, wiring, control systems and more, with hands-on exposure. Offers certificates and industry support. ',
+            'skills': 'PLC, SCADA, Power Systems, Embedded Systems, Electrical Wiring, Control Systems',
+            'apply_link': 'https://www.thinknexttraining.com/internship-in-electrical-engineering.aspx',
+        },
+        {
+            'company_name': 'KaaShiv Infotech',
+            'role': 'EEE/Electronics Engineering Intern',
+            'logo_initials': 'KI',
+            'location': 'Online/Offline (Bangalore & other cities)',
+            'duration': '1-6 Months',
+            'description': 'Internship/training for EEE/ECE students including embedded tech, MATLAB, signal processing, IoT, power electronics, robotics, and hardware basics; certificate provided. ',
+            'skills': 'Embedded Systems, MATLAB, Signal Processing, IoT, Power Electronics, Robotics',
+            'apply_link': 'https://www.kaashivinfotech.com/eee-internship-in-bangalore/',
+        },
+        {
+            'company_name': 'Indian Institute of Embedded Systems (IIES)',
+            'role': 'Embedded Systems & Electronics Intern',
+            'logo_initials': 'II',
+            'location': 'Online/Offline (Bangalore)',
+            'duration': '1-6 Months',
+            'description': 'Internship focused on embedded systems, firmware design, microcontroller programming, IoT and VLSI fundamentals. Offers certificates and project experience. ',
+            'skills': 'Embedded C/C++, Microcontrollers (ARM/8051), Firmware Development, IoT, Hardware Testing',
+            'apply_link': 'https://iies.in/vlsi-and-embedded-internship/',
+        },
+        {
+            'company_name': 'Internshala (Electronics & Electrical Internships)',
+            'role': 'Electrical/Electronics Engineering Intern',
+            'logo_initials': 'IN',
+            'location': 'Online/Offline (Various Companies in Bangalore)',
+            'duration': 'Varies by Role',
+            'description': 'Platform listing multiple electrical & electronics internships (work-from-home, remote & onsite) with roles across power systems, circuits, hardware support, testing and more. ',
+            'skills': 'Circuit Analysis, Power Electronics, Hardware Testing, Documentation, MS Excel',
+            'apply_link': 'https://internshala.com/internships/electronics-internship-in-bangalore',
+        },
+        {
+            'company_name': 'Infidata Technologies',
+            'role': 'Electrical & Electronics Intern',
+            'logo_initials': 'IT',
+            'location': 'Offline/Online (Bangalore)',
+            'duration': '1-6 Months',
+            'description': 'Engineering internship for diploma/B.Tech students including real-world electrical/electronics tech experience and industry guidance (certificate provided). ',
+            'skills': 'Circuit Design, PCB Basics, Electrical Systems, Technical Reporting, Team Collaboration',
+            'apply_link': 'https://infidata.in/internship-in-bangalore.php',
+        },
+        {
+            'company_name': 'Technofist',
+            'role': 'Electrical/Electronics Engineering Intern',
+            'logo_initials': 'TF',
+            'location': 'Offline/Hybrid (Bangalore)',
+            'duration': '1-4 Months',
+            'description': 'Internship in electrical and electronics domain including embedded systems fundamentals, microcontrollers, IoT, MATLAB and hardware basics. ',
+            'skills': 'Embedded C, Electrical Fundamentals, MATLAB, IoT Applications, Microcontrollers',
+            'apply_link': 'https://www.technofist.com/electricals_internship.html',
+        },
+        {
+            'company_name': 'ONLEI Technologies',
+            'role': 'Electrical & Electronics Intern',
+            'logo_initials': 'OT',
+            'location': 'Online/Offline (India)',
+            'duration': '1-3 Months',
+            'description': 'Internship/training for ECE & EEE students covering Python, machine learning, IoT, CCNA, robotics and more blended with electrical systems basics. ',
+            'skills': 'Python, Machine Learning, IoT, Robotics, CCNA',
+            'apply_link': 'https://onleitechnologies.com/internships-for-ece-students-and-eee-students/',
+        },
+        {
+            'company_name': 'StartAutomation.in',
+            'role': 'Industrial Automation/Electrical Intern',
+            'logo_initials': 'SA',
+            'location': 'Offline/Bangalore',
+            'duration': '1-6 Months',
+            'description': 'Internship focused on industrial automation, controls, electrical system fundamentals and practical systems exposure in automation contexts. ',
+            'skills': 'Industrial Automation, PLC/HMI Basics, Electrical Controls, Circuit Analysis, Field Testing',
+            'apply_link': 'https://www.startautomation.in/internship.html',
+        },
+        {
+            'company_name': 'Astrome Technologies (via Internshala/LinkedIn)',
+            'role': 'Electronics/Hardware Intern',
+            'logo_initials': 'AT',
+            'location': 'Offline/Hybrid (Bangalore)',
+            'duration': '1-6 Months',
+            'description': 'Internship in electronics hardware, system testing, embedded applications and prototype design (apply via portal listings). ',
+            'skills': 'Hardware Design, Embedded Firmware, Testing & Validation, Circuit Debugging, Documentation',
+            'apply_link': 'https://internshala.com/internships/electronics-internship-in-bangalore',
+        },
+        {
+            'company_name': 'Medetronix (via LinkedIn)',
+            'role': 'Electronics Engineering Intern',
+            'logo_initials': 'MX',
+            'location': 'Offline/Hybrid (Bangalore)',
+            'duration': '1-6 Months',
+            'description': 'Electronics internship with roles around system architecture, embedded design, testing and analysis — entry level for students (apply via LinkedIn). ',
+            'skills': 'System Architecture, Embedded Tools, Test Engineering, Signal Processing, Documentation',
+            'apply_link': 'https://www.linkedin.com/jobs/electronics-internship-jobs-bengaluru',
+        },
+        {
+            'company_name': 'LinkedIn/Burns & McDonnell India (Electrical Intern Roles)',
+            'role': 'Electrical Engineering Intern',
+            'logo_initials': 'BM',
+            'location': 'Offline/Hybrid (Bangalore)',
+            'duration': '1-6 Months',
+            'description': 'Engineering internship roles with exposure to power systems, substation support, electrical design and field engineering (positions found on LinkedIn). ',
+            'skills': 'Power Systems, Electrical Design, Safety Standards, Project Support, Field Testing',
+            'apply_link': 'https://in.linkedin.com/jobs/electrical-engineering-intern-jobs-bengaluru',
+        },
+    ],
+    'ece': [
+        {
+            'company_name': 'ThinkNEXT Technologies',
+            'role': 'Electrical & Electronics Engineering Intern',
+            'logo_initials': 'TN',
+            'location': 'Online/Offline',
+            'duration': '1-6 Months',
+            'description': 'Internship for EEE/ECE students covering industrial automation, power systems, embedded systems, PLC/SCADA, wiring, control systems and more, with hands-on exposure. Offers certificates and industry support. ',
+            'skills': 'PLC, SCADA, Power Systems, Embedded Systems, Electrical Wiring, Control Systems',
+            'apply_link': 'https://www.thinknexttraining.com/internship-in-electrical-engineering.aspx',
+        },
+        {
+            'company_name': 'KaaShiv Infotech',
+            'role': 'EEE/Electronics Engineering Intern',
+            'logo_initials': 'KI',
+            'location': 'Online/Offline (Bangalore & other cities)',
+            'duration': '1-6 Months',
+            'description': 'Internship/training for EEE/ECE students including embedded tech, MATLAB, signal processing, IoT, power electronics, robotics, and hardware basics; certificate provided. ',
+            'skills': 'Embedded Systems, MATLAB, Signal Processing, IoT, Power Electronics, Robotics',
+            'apply_link': 'https://www.kaashivinfotech.com/eee-internship-in-bangalore/',
+        },
+        {
+            'company_name': 'Indian Institute of Embedded Systems (IIES)',
+            'role': 'Embedded Systems & Electronics Intern',
+            'logo_initials': 'II',
+            'location': 'Online/Offline (Bangalore)',
+            'duration': '1-6 Months',
+            'description': 'Internship focused on embedded systems, firmware design, microcontroller programming, IoT and VLSI fundamentals. Offers certificates and project experience. ',
+            'skills': 'Embedded C/C++, Microcontrollers (ARM/8051), Firmware Development, IoT, Hardware Testing',
+            'apply_link': 'https://iies.in/vlsi-and-embedded-internship/',
+        },
+        {
+            'company_name': 'Internshala (Electronics & Electrical Internships)',
+            'role': 'Electrical/Electronics Engineering Intern',
+            'logo_initials': 'IN',
+            'location': 'Online/Offline (Various Companies in Bangalore)',
+            'duration': 'Varies by Role',
+            'description': 'Platform listing multiple electrical & electronics internships (work-from-home, remote & onsite) with roles across power systems, circuits, hardware support, testing and more. ',
+            'skills': 'Circuit Analysis, Power Electronics, Hardware Testing, Documentation, MS Excel',
+            'apply_link': 'https://internshala.com/internships/electronics-internship-in-bangalore',
+        },
+        {
+            'company_name': 'Infidata Technologies',
+            'role': 'Electrical & Electronics Intern',
+            'logo_initials': 'IT',
+            'location': 'Offline/Online (Bangalore)',
+            'duration': '1-6 Months',
+            'description': 'Engineering internship for diploma/B.Tech students including real-world electrical/electronics tech experience and industry guidance (certificate provided). ',
+            'skills': 'Circuit Design, PCB Basics, Electrical Systems, Technical Reporting, Team Collaboration',
+            'apply_link': 'https://infidata.in/internship-in-bangalore.php',
+        },
+        {
+            'company_name': 'Technofist',
+            'role': 'Electrical/Electronics Engineering Intern',
+            'logo_initials': 'TF',
+            'location': 'Offline/Hybrid (Bangalore)',
+            'duration': '1-4 Months',
+            'description': 'Internship in electrical and electronics domain including embedded systems fundamentals, microcontrollers, IoT, MATLAB and hardware basics. ',
+            'skills': 'Embedded C, Electrical Fundamentals, MATLAB, IoT Applications, Microcontrollers',
+            'apply_link': 'https://www.technofist.com/electricals_internship.html',
+        },
+        {
+            'company_name': 'ONLEI Technologies',
+            'role': 'Electrical & Electronics Intern',
+            'logo_initials': 'OT',
+            'location': 'Online/Offline (India)',
+            'duration': '1-3 Months',
+            'description': 'Internship/training for ECE & EEE students covering Python, machine learning, IoT, CCNA, robotics and more blended with electrical systems basics. ',
+            'skills': 'Python, Machine Learning, IoT, Robotics, CCNA',
+            'apply_link': 'https://onleitechnologies.com/internships-for-ece-students-and-eee-students/',
+        },
+        {
+            'company_name': 'StartAutomation.in',
+            'role': 'Industrial Automation/Electrical Intern',
+            'logo_initials': 'SA',
+            'location': 'Offline/Bangalore',
+            'duration': '1-6 Months',
+            'description': 'Internship focused on industrial automation, controls, electrical system fundamentals and practical systems exposure in automation contexts. ',
+            'skills': 'Industrial Automation, PLC/HMI Basics, Electrical Controls, Circuit Analysis, Field Testing',
+            'apply_link': 'https://www.startautomation.in/internship.html',
+        },
+        {
+            'company_name': 'Astrome Technologies (via Internshala/LinkedIn)',
+            'role': 'Electronics/Hardware Intern',
+            'logo_initials': 'AT',
+            'location': 'Offline/Hybrid (Bangalore)',
+            'duration': '1-6 Months',
+            'description': 'Internship in electronics hardware, system testing, embedded applications and prototype design (apply via portal listings). ',
+            'skills': 'Hardware Design, Embedded Firmware, Testing & Validation, Circuit Debugging, Documentation',
+            'apply_link': 'https://internshala.com/internships/electronics-internship-in-bangalore',
+        },
+        {
+            'company_name': 'Medetronix (via LinkedIn)',
+            'role': 'Electronics Engineering Intern',
+            'logo_initials': 'MX',
+            'location': 'Offline/Hybrid (Bangalore)',
+            'duration': '1-6 Months',
+            'description': 'Electronics internship with roles around system architecture, embedded design, testing and analysis — entry level for students (apply via LinkedIn). ',
+            'skills': 'System Architecture, Embedded Tools, Test Engineering, Signal Processing, Documentation',
+            'apply_link': 'https://www.linkedin.com/jobs/electronics-internship-jobs-bengaluru',
+        },
+        {
+            'company_name': 'LinkedIn/Burns & McDonnell India (Electrical Intern Roles)',
+            'role': 'Electrical Engineering Intern',
+            'logo_initials': 'BM',
+            'location': 'Offline/Hybrid (Bangalore)',
+            'duration': '1-6 Months',
+            'description': 'Engineering internship roles with exposure to power systems, substation support, electrical design and field engineering (positions found on LinkedIn). ',
+            'skills': 'Power Systems, Electrical Design, Safety Standards, Project Support, Field Testing',
+            'apply_link': 'https://in.linkedin.com/jobs/electrical-engineering-intern-jobs-bengaluru',
+        },
+    ],
+    'auto': [
+        {
+            'company_name': 'Volvo Group India Pvt. Ltd.',
+            'role': 'Automobile Engineering Intern (Spark Intern Program)',
+            'logo_initials': 'VG',
+            'location': 'Offline (Bangalore)',
+            'duration': 'Up to 9 Months',
+            'description': 'Internship in automotive engineering with exposure to transport solutions, vehicle systems, prototyping, and industry projects. Opportunity for hands-on learning and professional growth. Mentioned as open in Bangalore. ',
+            'skills': 'Vehicle Systems, Automotive Design, Prototyping, CAD, Team Collaboration',
+            'apply_link': 'https://jobs.volvogroup.com',
+        },
+        {
+            'company_name': 'Ather Energy',
+            'role': 'Automobile & EV Engineering Intern',
+            'logo_initials': 'AE',
+            'location': 'Offline/Hybrid (Bangalore)',
+            'duration': '3-6 Months',
+            'description': 'Internship focusing on electric vehicle technology, motor control, battery systems, and product innovation for electric scooters and vehicles. Good for EV-oriented automobile roles. ',
+            'skills': 'EV Systems, Battery Tech, Motor Control, Testing & Validation, Product Design',
+            'apply_link': 'https://www.atherenergy.com/careers',
+        },
+        {
+            'company_name': 'Ola Electric',
+            'role': 'Automobile & E-Mobility Intern',
+            'logo_initials': 'OE',
+            'location': 'Offline/Hybrid (Bangalore)',
+            'duration': '3-6 Months',
+            'description': 'Internship in electric vehicle product development, operations, supply chain and R&D; often listed on company career portals and LinkedIn. ',
+            'skills': 'E-Mobility Design, Product Support, Supply Chain Basics, Vehicle Testing, Documentation',
+            'apply_link': 'https://olaelectric.com/careers',
+        },
+        {
+            'company_name': 'Internshala (Automobile Engineering Internships)',
+            'role': 'Automobile Engineering Intern',
+            'logo_initials': 'IN',
+            'location': 'Online/Offline (Various Cities including Bangalore)',
+            'duration': '1-6 Months (varies by posting)',
+            'description': 'Portal listing multiple automobile internships including design, vehicle maintenance, automotive engineering support and remote roles. ',
+            'skills': 'AutoCAD, Vehicle Diagnostics, Quality Inspection, Documentation, Field Assistance',
+            'apply_link': 'https://internshala.com/internships/automobile-engineering-internship',
+        },
+        {
+            'company_name': 'Fyn (EV & Automotive Startup)',
+            'role': 'Automobile Engineering Intern',
+            'logo_initials': 'FY',
+            'location': 'Offline (Bangalore)',
+            'duration': '1-6 Months (varies)',
+            'description': 'Internship involving vehicle servicing, testing, prototyping, IoT device management, and coordination with partners — especially EV logistics and fleet systems. ',
+            'skills': 'Vehicle Servicing, Prototyping, IoT Basics, Testing & Validation, 2W/4W Handling',
+            'apply_link': 'https://jobs.weekday.works/fyn-automobile-engineering-internship-in-bangalore',
+        },
+        {
+            'company_name': 'Tata Motors',
+            'role': 'Automobile Engineering Intern',
+            'logo_initials': 'TM',
+            'location': 'Online/Offline (India-wide opportunities including Bangalore)',
+            'duration': '2-6 Months (typical)',
+            'description': 'Internships covering automotive engineering, powertrain, vehicle design, and production systems — posted seasonally on Tata Motors career portal. ',
+            'skills': 'Vehicle Dynamics, Powertrain Basics, Automotive Design, Testing & Quality, Team Work',
+            'apply_link': 'https://www.tatamotors.com/careers',
+        },
+        {
+            'company_name': 'Mahindra & Mahindra',
+            'role': 'Automobile Engineering Intern',
+            'logo_initials': 'MM',
+            'location': 'Online/Offline (India-wide)',
+            'duration': '3-6 Months',
+            'description': 'Internship in automotive engineering covering chassis, engines, R&D basics, and testing; posted via Mahindra careers portal or recruitment platforms. ',
+            'skills': 'Chassis Design, Engine Testing, Quality Inspection, CAD Tools, Project Support',
+            'apply_link': 'https://www.mahindra.com/careers',
+        },
+        {
+            'company_name': 'TVS Motor Company',
+            'role': 'Automobile Engineering Intern',
+            'logo_initials': 'TV',
+            'location': 'Offline/Hybrid (Industrywide opportunities)',
+            'duration': '1-3 Months',
+            'description': 'Internship opportunities in vehicle design, engine systems, automotive electronics and manufacturing tracked via TVS Motor careers or internship listings. ',
+            'skills': 'Engine Systems, Automotive Electronics, Manufacturing Basics, Maintenance Support, Documentation',
+            'apply_link': 'https://www.tvsmotor.com/careers',
+        },
+        {
+            'company_name': 'Bosch India (Automotive Division)',
+            'role': 'Automotive Engineering Intern',
+            'logo_initials': 'BI',
+            'location': 'Offline (Industry R&D & Test Sites)',
+            'duration': '1-6 Months',
+            'description': 'Internship in automotive systems, sensors, powertrain components and diagnostics — worth checking via Bosch India careers or LinkedIn for openings. ',
+            'skills': 'Diagnostics, Automotive Sensors, Powertrain Components, Testing Tools, Report Writing',
+            'apply_link': 'https://www.bosch.in/careers',
+        },
+        {
+            'company_name': 'Dynamatic Technologies',
+            'role': 'Automotive/Precision Engineering Intern',
+            'logo_initials': 'DT',
+            'location': 'Offline (Bangalore)',
+            'duration': '1-6 Months',
+            'description': 'Engineering internship with a precision engineering supplier to automotive and aerospace industries — great for learning manufacturing, components & systems. ',
+            'skills': 'Precision Machining, Automotive Components, Manufacturing Support, Quality Control, Documentation',
+            'apply_link': 'https://dynamatics.com/careers',
+        },
+    ],
+    'ice': [
+        {
+            'company_name': 'Sanfoundry',
+            'role': 'Systems & Control / Instrumentation Intern',
+            'logo_initials': 'SF',
+            'location': 'Online / Bangalore',
+            'duration': '1-6 Months',
+            'description': 'Internships focused on systems, control theory, signals, instrumentation basics, process control, and related engineering tutorial creation & problem solving. Good for theory + application exposure. ',
+            'skills': 'Control Systems, Signal Analysis, Feedback Systems, Process Control, Instrumentation Basics',
+            'apply_link': 'https://www.sanfoundry.com/internships-instrumentation-engineering/',
+        },
+        {
+            'company_name': 'Internshala (Instrumentation & Control Listings)',
+            'role': 'Instrumentation & Control Engineering Intern',
+            'logo_initials': 'IN',
+            'location': 'Online / Offline (Bangalore & Other Cities)',
+            'duration': '1-6 Months (varies by role)',
+            'description': 'Platform aggregating multiple internships in instrumentation, control systems, embedded systems, automation, PCB design, test & measurement roles near Bangalore and across India. ',
+            'skills': 'Embedded Systems, Sensors & Actuators, Control Systems, Automation, Circuit Design',
+            'apply_link': 'https://internshala.com/internships/instrumentation-and-control-engineering-internship-in-bangalore',
+        },
+        {
+            'company_name': 'Innotech Automation Pvt. Ltd.',
+            'role': 'Instrumentation & Automation Intern',
+            'logo_initials': 'IA',
+            'location': 'Offline / Bangalore area',
+            'duration': '1-3 Months',
+            'description': 'Company known for automation systems & sensor integration — suitable for practical PLC/SCADA and instrumentation exposure (recorded in student internship placements). ',
+            'skills': 'PLC/SCADA Basics, Industrial Sensors, Automation, Control Systems, Field Measurements',
+            'apply_link': 'https://www.innotechautomation.com',
+        },
+        {
+            'company_name': 'Axis Solutions Pvt. Ltd.',
+            'role': 'Instrumentation Intern',
+            'logo_initials': 'AS',
+            'location': 'Offline / Bangalore area',
+            'duration': '1-3 Months',
+            'description': 'Engineering firm engaged in instrumentation & control projects with hands-on learning for students across sensors, instrumentation design, and integration. ',
+            'skills': 'Instrumentation Design, Measurement Techniques, Control Basics, Documentation, Team Projects',
+            'apply_link': 'https://www.axissolutions.in',
+        },
+        {
+            'company_name': 'MASIBUS Pvt. Ltd.',
+            'role': 'Instrumentation & Control Intern',
+            'logo_initials': 'MB',
+            'location': 'Offline / Bangalore area',
+            'duration': '1-3 Months',
+            'description': 'Instrumentation product company — exposure to industrial instrumentation devices, process measurement systems, and control elements (documented intern placements). ',
+            'skills': 'Industrial Instrumentation, Sensors, Signal Conditioning, Control Fundamentals, Testing',
+            'apply_link': 'https://www.masibus.com/',
+        },
+        {
+            'company_name': 'Soul Electric Pvt. Ltd.',
+            'role': 'Control Systems / Instrumentation Intern',
+            'logo_initials': 'SE',
+            'location': 'Offline / Bangalore area',
+            'duration': '2-4 Months',
+            'description': 'Electrical & instrumentation firm where trainees work on control systems, measurement, and electrical instrumentation (interns have received stipends historically). ',
+            'skills': 'Control Systems, PLC Basics, Electrical Instrumentation, Testing, Measurement Tools',
+            'apply_link': 'https://soulectric.com/',
+        },
+        {
+            'company_name': 'PLC/SCADA Training Institutes (Bangalore)',
+            'role': 'Industrial Instrumentation Intern',
+            'logo_initials': 'PT',
+            'location': 'Offline / Bangalore',
+            'duration': '1-3 Months',
+            'description': 'Training organizations in PLC/SCADA & DCS (which often provide internship + certificate programs with practical lab exposure). Good for foundational automation skills. ',
+            'skills': 'PLC Programming, SCADA, DCS Basics, Instrumentation, Process Automation',
+            'apply_link': 'https://internshala.com/internships/instrumentation-and-control-engineering-internship-in-bangalore',
+        },
+        {
+            'company_name': 'Embedded & IoT Platforms (via Internshala)',
+            'role': 'Instrumentation & Embedded Intern',
+            'logo_initials': 'EI',
+            'location': 'Online / Hybrid',
+            'duration': '1-4 Months',
+            'description': 'Internships involving sensors, microcontrollers, data acquisition, and control loop fundamentals — good stepping stone into instrumentation and automation roles. ',
+            'skills': 'Arduino/Raspberry Pi, Sensors & Interfacing, Control Logic, Data Acquisition, Python/C Programming',
+            'apply_link': 'https://internshala.com/internships/instrumentation-and-control-engineering-internship-in-bangalore',
+        },
+        {
+            'company_name': 'Control & Automation Startups (via LinkedIn)',
+            'role': 'Instrumentation/Automation Intern',
+            'logo_initials': 'CA',
+            'location': 'Offline/Hybrid (Bangalore)',
+            'duration': '1-6 Months',
+            'description': 'Startups working on automation, industrial control products, IoT systems, and process instrumentation advertise intern roles on LinkedIn & other portals. ',
+            'skills': 'Industrial Automation, Control Systems, Sensor Networks, Documentation, Team Projects',
+            'apply_link': 'https://www.linkedin.com/jobs/instrumentation-intern-jobs-bengaluru',
+        },
+        {
+            'company_name': 'Automation & Industrial Solutions Firms',
+            'role': 'Instrumentation Intern',
+            'logo_initials': 'AI',
+            'location': 'Offline / Bangalore & nearby',
+            'duration': '1-6 Months',
+            'description': 'Local industrial automation service providers that hire interns for sensor calibration, control panel basics, and process measurement work — search on portals. ',
+            'skills': 'Process Measurement, Calibration, Instrumentation Tools, Report Writing, Team Work',
+            'apply_link': 'https://internshala.com/internships/instrumentation-and-control-engineering-internship-in-bangalore',
+        },
+    ],
+}
+
+
+def load_internships(apps, schema_editor):
+    Internship = apps.get_model('accounts', 'Internship')
+    now = timezone.now()
+    for branch, internships in INTERNSHIPS.items():
+        for position, data in enumerate(internships):
+            internship = Internship.objects.create(branch=branch, **data)
+            # Keep the original listing order under ordering = ['-posted_date']
+            Internship.objects.filter(pk=internship.pk).update(posted_date=now - timedelta(seconds=position))
+
+
+def unload_internships(apps, schema_editor):
+    Internship = apps.get_model('accounts', 'Internship')
+    for branch, internships in INTERNSHIPS.items():
+        for data in internships:
+            Internship.objects.filter(
+                branch=branch,
+                company_name=data['company_name'],
+                role=data['role'],
+                apply_link=data['apply_link'],
+            ).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0013_internship_branches'),
+    ]
+
+    operations = [
+        migrations.RunPython(load_internships, unload_internships),
+    ]
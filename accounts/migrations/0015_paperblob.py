@@ -0,0 +1,35 @@
+# Generated by Django 5.2.9 on 2026-10-17 17:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0014_load_internships'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PaperBlob',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True)),
+                ('file', models.FileField(max_length=255, upload_to='question_papers/blobs/')),
+                ('size', models.PositiveBigIntegerField()),
+                ('ref_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AlterField(
+            model_name='questionpaper',
+            name='file',
+            field=models.FileField(max_length=255, upload_to='question_papers/'),
+        ),
+        migrations.AddField(
+            model_name='questionpaper',
+            name='blob',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='papers', to='accounts.paperblob'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.9 on 2026-10-17 17:56
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0015_paperblob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChunkedUpload',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('uploaded_by', models.CharField(max_length=100)),
+                ('role', models.CharField(max_length=10)),
+                ('college', models.CharField(max_length=10)),
+                ('branch', models.CharField(max_length=10)),
+                ('semester', models.CharField(max_length=2)),
+                ('doc_type', models.CharField(max_length=20)),
+                ('title', models.CharField(max_length=200)),
+                ('subject', models.CharField(max_length=100)),
+                ('year', models.IntegerField()),
+                ('filename', models.CharField(max_length=255)),
+                ('size', models.PositiveBigIntegerField()),
+                ('sha256', models.CharField(blank=True, max_length=64)),
+                ('offset', models.PositiveBigIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.9 on 2026-10-17 18:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0016_chunkedupload'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='otpverification',
+            index=models.Index(condition=models.Q(('is_verified', False)), fields=['email', '-created_at'], name='otp_lookup_idx'),
+        ),
+    ]
@@ -0,0 +1,65 @@
+from django.db import migrations
+
+
+# Frozen copy of the search index SQL as first shipped; accounts/search.py
+# holds the current definition
+FTS_TABLE = 'accounts_questionpaper_fts'
+
+SQLITE_INDEX_SQL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, subject,
+        content='accounts_questionpaper', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON accounts_questionpaper BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, subject) VALUES (new.id, new.title, new.subject);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON accounts_questionpaper BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, subject) VALUES ('delete', old.id, old.title, old.subject);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF title, subject ON accounts_questionpaper BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, subject) VALUES ('delete', old.id, old.title, old.subject);
+        INSERT INTO {FTS_TABLE}(rowid, title, subject) VALUES (new.id, new.title, new.subject);
+    END""",
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+
+SQLITE_DROP_SQL = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+PG_DOCUMENT = "(setweight(to_tsvector('simple', title), 'A') || setweight(to_tsvector('simple', subject), 'B'))"
+
+PG_INDEX_SQL = [
+    f"CREATE INDEX IF NOT EXISTS paper_search_idx ON accounts_questionpaper USING GIN ({PG_DOCUMENT})",
+]
+
+PG_DROP_SQL = [
+    "DROP INDEX IF EXISTS paper_search_idx",
+]
+
+
+def forwards(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    for sql in {'sqlite': SQLITE_INDEX_SQL, 'postgresql': PG_INDEX_SQL}.get(vendor, []):
+        schema_editor.execute(sql)
+
+
+def backwards(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    for sql in {'sqlite': SQLITE_DROP_SQL, 'postgresql': PG_DROP_SQL}.get(vendor, []):
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0017_otp_lookup_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
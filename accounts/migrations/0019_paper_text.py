@@ -0,0 +1,132 @@
+# Generated by Django 5.2.9 on 2026-10-17 18:07
+
+import importlib
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# Index as created by 0018; gone on SQLite once AddField below rebuilds the table
+search_v1 = importlib.import_module('accounts.migrations.0018_paper_search_index')
+
+# Frozen copy of the search index SQL with paper text, as this migration
+# installs it. 0020 and 0021 drop and reinstall the index with
+# remove_index/install_index around their table rebuilds, so this copy must
+# not change; accounts/search.py holds the current definition
+FTS_TABLE = 'accounts_questionpaper_fts'
+FTS_VIEW = 'accounts_questionpaper_search'
+
+
+def _fts_delete(paper_id):
+    return (
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, subject, body) "
+        f"SELECT 'delete', id, title, subject, body FROM {FTS_VIEW} WHERE id = {paper_id};"
+    )
+
+
+def _fts_insert(paper_id):
+    return (
+        f"INSERT INTO {FTS_TABLE}(rowid, title, subject, body) "
+        f"SELECT id, title, subject, body FROM {FTS_VIEW} WHERE id = {paper_id};"
+    )
+
+
+SQLITE_TRIGGERS = [
+    ('paper_ai', 'AFTER INSERT ON accounts_questionpaper', _fts_insert('new.id')),
+    ('paper_bu', 'BEFORE UPDATE OF title, subject ON accounts_questionpaper', _fts_delete('old.id')),
+    ('paper_au', 'AFTER UPDATE OF title, subject ON accounts_questionpaper', _fts_insert('new.id')),
+    ('paper_bd', 'BEFORE DELETE ON accounts_questionpaper', _fts_delete('old.id')),
+    ('text_bi', 'BEFORE INSERT ON accounts_papertext', _fts_delete('new.paper_id')),
+    ('text_ai', 'AFTER INSERT ON accounts_papertext', _fts_insert('new.paper_id')),
+    ('text_bu', 'BEFORE UPDATE ON accounts_papertext', _fts_delete('old.paper_id')),
+    ('text_au', 'AFTER UPDATE ON accounts_papertext', _fts_insert('new.paper_id')),
+    ('text_bd', 'BEFORE DELETE ON accounts_papertext', _fts_delete('old.paper_id')),
+    ('text_ad', 'AFTER DELETE ON accounts_papertext', _fts_insert('old.paper_id')),
+]
+
+SQLITE_INDEX_SQL = [
+    f"""CREATE VIEW IF NOT EXISTS {FTS_VIEW} AS
+        SELECT p.id, p.title, p.subject, coalesce(t.content, '') AS body
+        FROM accounts_questionpaper p LEFT JOIN accounts_papertext t ON t.paper_id = p.id""",
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, subject, body,
+        content='{FTS_VIEW}', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )""",
+] + [
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_{name} {event} BEGIN {body} END"
+    for name, event, body in SQLITE_TRIGGERS
+] + [
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+
+SQLITE_DROP_SQL = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_{name}" for name, _, _ in SQLITE_TRIGGERS
+] + [
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+    f"DROP VIEW IF EXISTS {FTS_VIEW}",
+]
+
+PG_DOCUMENT = "(setweight(to_tsvector('simple', title), 'A') || setweight(to_tsvector('simple', subject), 'B'))"
+PG_TEXT_DOCUMENT = "to_tsvector('simple', content)"
+
+PG_INDEX_SQL = [
+    f"CREATE INDEX IF NOT EXISTS paper_search_idx ON accounts_questionpaper USING GIN ({PG_DOCUMENT})",
+    f"CREATE INDEX IF NOT EXISTS paper_text_search_idx ON accounts_papertext USING GIN ({PG_TEXT_DOCUMENT})",
+]
+
+PG_DROP_SQL = [
+    "DROP INDEX IF EXISTS paper_search_idx",
+    "DROP INDEX IF EXISTS paper_text_search_idx",
+]
+
+
+def install_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    for sql in {'sqlite': SQLITE_INDEX_SQL, 'postgresql': PG_INDEX_SQL}.get(vendor, []):
+        schema_editor.execute(sql)
+
+
+def remove_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    for sql in {'sqlite': SQLITE_DROP_SQL, 'postgresql': PG_DROP_SQL}.get(vendor, []):
+        schema_editor.execute(sql)
+
+
+def reindex_with_text(apps, schema_editor):
+    search_v1.backwards(apps, schema_editor)
+    install_index(apps, schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0018_paper_search_index'),
+    ]
+
+    operations = [
+        # Reversed last, after the table rebuilds undoing the fields below
+        migrations.RunPython(migrations.RunPython.noop, search_v1.forwards),
+        migrations.CreateModel(
+            name='PaperText',
+            fields=[
+                ('paper', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='text', serialize=False, to='accounts.questionpaper')),
+                ('content', models.TextField()),
+            ],
+        ),
+        migrations.AddField(
+            model_name='questionpaper',
+            name='page_count',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='questionpaper',
+            name='text_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=10),
+        ),
+        migrations.AddIndex(
+            model_name='questionpaper',
+            index=models.Index(condition=models.Q(('text_status', 'pending')), fields=['id'], name='paper_text_pending_idx'),
+        ),
+        migrations.RunPython(reindex_with_text, remove_index),
+    ]
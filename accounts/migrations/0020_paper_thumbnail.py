@@ -0,0 +1,27 @@
+# Generated by Django 5.2.9 on 2026-10-17 18:11
+
+import importlib
+
+from django.db import migrations, models
+
+
+# SQLite rebuilds the table for AddField, which fails while the search view
+# refers to it, so the index as 0019 created it is dropped around the change
+search_v2 = importlib.import_module('accounts.migrations.0019_paper_text')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0019_paper_text'),
+    ]
+
+    operations = [
+        migrations.RunPython(search_v2.remove_index, search_v2.install_index),
+        migrations.AddField(
+            model_name='questionpaper',
+            name='thumbnail',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.RunPython(search_v2.install_index, search_v2.remove_index),
+    ]
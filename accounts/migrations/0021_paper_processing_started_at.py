@@ -0,0 +1,31 @@
+# Generated by Django 5.2.9 on 2026-10-17 18:35
+
+import importlib
+
+from django.db import migrations, models
+
+
+# The table rebuild for AddField fails while the search view refers to the
+# table; the index as 0019 created it is dropped around it, as in 0020
+search_v2 = importlib.import_module('accounts.migrations.0019_paper_text')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0020_paper_thumbnail'),
+    ]
+
+    operations = [
+        migrations.RunPython(search_v2.remove_index, search_v2.install_index),
+        migrations.AddField(
+            model_name='questionpaper',
+            name='processing_started_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='questionpaper',
+            index=models.Index(condition=models.Q(('text_status', 'processing')), fields=['processing_started_at'], name='paper_text_processing_idx'),
+        ),
+        migrations.RunPython(search_v2.install_index, search_v2.remove_index),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-17 18:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0021_paper_processing_started_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notificationoutbox',
+            name='delivered_to',
+            field=models.TextField(blank=True, default=''),
+        ),
+    ]
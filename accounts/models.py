@@ -2,6 +2,7 @@ from django.db import models
 from django.utils import timezone
 from datetime import timedelta
 import random
+import uuid
 
 class OTPVerification(models.Model):
     email = models.EmailField()
@@ -9,9 +10,11 @@ class OTPVerification(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     is_verified = models.BooleanField(default=False)
     
+    # OTP valid for 10 minutes
+    VALIDITY = timedelta(minutes=10)
+    
     def is_valid(self):
-        # OTP valid for 10 minutes
-        return timezone.now() < self.created_at + timedelta(minutes=10)
+        return timezone.now() < self.created_at + self.VALIDITY
     
     @staticmethod
     def generate_otp():
@@ -19,11 +22,29 @@ class OTPVerification(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # DatabaseOTPStore.verify: latest unverified OTP for an email. Partial,
+            # because Django writes is_verified=False as NOT is_verified, which a
+            # plain (email, is_verified, created_at) index cannot seek on
+            models.Index(fields=['email', '-created_at'], condition=models.Q(is_verified=False), name='otp_lookup_idx'),
+        ]
     
     def __str__(self):
         return f"{self.email} - {self.otp}"
 
 
+class PaperBlob(models.Model):
+    """Content-addressed file shared by every QuestionPaper with the same bytes"""
+    sha256 = models.CharField(max_length=64, unique=True)
+    file = models.FileField(upload_to='question_papers/blobs/', max_length=255)
+    size = models.PositiveBigIntegerField()
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    def __str__(self):
+        return f"{self.sha256[:12]} ({self.ref_count} refs)"
+
+
 class QuestionPaper(models.Model):
     BRANCH_CHOICES = [
         ('cse', 'Computer Science & Engineering'),
@@ -59,6 +80,13 @@ class QuestionPaper(models.Model):
         ('rrp', 'RRP'),
     ]
     
+    TEXT_STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('processing', 'Processing'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ]
+    
     branch = models.CharField(max_length=10, choices=BRANCH_CHOICES)
     college = models.CharField(max_length=10, choices=COLLEGE_CHOICES, default='meip')
     semester = models.CharField(max_length=2, choices=SEMESTER_CHOICES)
@@ -67,14 +95,107 @@ class QuestionPaper(models.Model):
     subject = models.CharField(max_length=100)
     year = models.IntegerField()
     uploaded_by = models.CharField(max_length=100)
-    file = models.FileField(upload_to='question_papers/')
+    file = models.FileField(upload_to='question_papers/', max_length=255)
+    blob = models.ForeignKey(PaperBlob, on_delete=models.PROTECT, related_name='papers', blank=True, null=True)
     uploaded_at = models.DateTimeField(auto_now_add=True)
+    # PDF text extraction (accounts/extraction.py, extract_paper_text command)
+    text_status = models.CharField(max_length=10, choices=TEXT_STATUS_CHOICES, default='pending')
+    # When a worker claimed the paper; claims older than PAPER_TEXT_STALE_AFTER are taken back
+    processing_started_at = models.DateTimeField(blank=True, null=True)
+    page_count = models.PositiveIntegerField(blank=True, null=True)
+    # Storage name of the first-page preview (accounts/thumbnails.py), rendered by the same worker
+    thumbnail = models.CharField(max_length=255, blank=True, default='')
     
     class Meta:
         ordering = ['-uploaded_at']
+        indexes = [
+            # view_notes_view: filter(college, branch, semester[, doc_type]) keyset
+            # paginated on (uploaded_at, id), newest first
+            models.Index(fields=['college', 'branch', 'semester', '-uploaded_at', '-id'], name='paper_listing_idx'),
+            models.Index(fields=['college', 'branch', 'semester', 'doc_type', '-uploaded_at', '-id'], name='paper_doc_type_idx'),
+            # manage_papers_view: filter(college, branch, uploaded_by) ordered by newest
+            models.Index(fields=['college', 'branch', 'uploaded_by', '-uploaded_at'], name='paper_uploader_idx'),
+            # extract_paper_text: papers still waiting for extraction, oldest first
+            models.Index(fields=['id'], condition=models.Q(text_status='pending'), name='paper_text_pending_idx'),
+            # ... and papers claimed by a worker, to reclaim those it never finished
+            models.Index(fields=['processing_started_at'], condition=models.Q(text_status='processing'), name='paper_text_processing_idx'),
+        ]
     
     def __str__(self):
         return f"{self.title} - {self.branch} - Sem {self.semester}"
+    
+    @property
+    def thumbnail_filename(self):
+        return self.thumbnail.rsplit('/', 1)[-1]
+
+
+class PaperText(models.Model):
+    """Text extracted from a paper's PDF, indexed for search"""
+    paper = models.OneToOneField(QuestionPaper, on_delete=models.CASCADE, primary_key=True, related_name='text')
+    content = models.TextField()
+    
+    def __str__(self):
+        return f"Text of {self.paper}"
+
+
+class ChunkedUpload(models.Model):
+    """A resumable upload in progress; chunks are written in place into one partial file"""
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    uploaded_by = models.CharField(max_length=100)
+    role = models.CharField(max_length=10)
+    college = models.CharField(max_length=10)
+    branch = models.CharField(max_length=10)
+    semester = models.CharField(max_length=2)
+    doc_type = models.CharField(max_length=20)
+    title = models.CharField(max_length=200)
+    subject = models.CharField(max_length=100)
+    year = models.IntegerField()
+    filename = models.CharField(max_length=255)
+    size = models.PositiveBigIntegerField()
+    sha256 = models.CharField(max_length=64, blank=True)
+    offset = models.PositiveBigIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    def __str__(self):
+        return f"{self.filename} - {self.offset}/{self.size} bytes"
+
+
+class NotificationOutbox(models.Model):
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('processing', 'Processing'),
+        ('sent', 'Sent'),
+        ('failed', 'Failed'),
+    ]
+    
+    paper = models.ForeignKey(QuestionPaper, on_delete=models.CASCADE, related_name='notifications')
+    college = models.CharField(max_length=10)
+    branch = models.CharField(max_length=10)
+    semester = models.CharField(max_length=2)
+    doc_type = models.CharField(max_length=20)
+    title = models.CharField(max_length=200)
+    subject = models.CharField(max_length=100)
+    uploaded_by = models.CharField(max_length=100)
+    file_path = models.CharField(max_length=255)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveIntegerField(default=0)
+    claimed_by = models.CharField(max_length=64, blank=True, default='')
+    claimed_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True, default='')
+    # Recipients already sent to, one per line, so retries skip them
+    delivered_to = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(blank=True, null=True)
+    
+    class Meta:
+        ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='outbox_status_created_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.title} - {self.college}/{self.branch}/Sem {self.semester} ({self.status})"
 
 
 class StudentNotification(models.Model):
@@ -86,6 +207,16 @@ class StudentNotification(models.Model):
     last_viewed = models.DateTimeField(auto_now=True)
     created_at = models.DateTimeField(auto_now_add=True)
     
+    class Meta:
+        indexes = [
+            # Upload fan-out; email is a trailing key so the index covers the query
+            models.Index(fields=['college', 'branch', 'semester', 'wants_notifications', 'email'], name='notification_fanout_idx'),
+        ]
+        constraints = [
+            # Conflict target for the bulk subscription upsert in accounts/subscriptions.py
+            models.UniqueConstraint(fields=['email', 'college', 'branch', 'semester'], name='unique_student_subscription'),
+        ]
+    
     def __str__(self):
         return f"{self.email} - {self.college} - {self.branch or 'All'} - Sem {self.semester or 'All'}"
 class Internship(models.Model):
@@ -93,6 +224,12 @@ class Internship(models.Model):
         ('cse', 'Computer Science & Engineering'),
         ('ist', 'Information Science & Technology'),
         ('both', 'Both CSE & ISE'),
+        ('mech', 'Mechanical Engineering'),
+        ('civil', 'Civil Engineering'),
+        ('eee', 'Electrical & Electronics Engineering'),
+        ('ece', 'Electronics & Communication Engineering'),
+        ('auto', 'Automobile Engineering'),
+        ('ice', 'Instrumentation & Control Engineering'),
     ]
     
     company_name = models.CharField(max_length=200)
@@ -109,9 +246,20 @@ class Internship(models.Model):
     
     class Meta:
         ordering = ['-posted_date']
+        indexes = [
+            # internships_view: filter(branch__in, is_active=True) ordered by newest
+            models.Index(fields=['branch', 'is_active', '-posted_date'], name='internship_listing_idx'),
+        ]
     
     def __str__(self):
         return f"{self.company_name} - {self.role}"
     
+    @staticmethod
+    def listing_branches(branch):
+        """Internship.branch values shown on a student branch's page"""
+        if branch in ('cse', 'ist'):
+            return [branch, 'both']
+        return [branch]
+    
     def get_skills_list(self):
         return [skill.strip() for skill in self.skills.split(',')]
\ No newline at end of file
@@ -0,0 +1,346 @@
+import base64
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from email.mime.base import MIMEBase
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.mail import EmailMessage, get_connection
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import NotificationOutbox, StudentNotification
+
+
+# Read size for attachment encoding; a multiple of 57 bytes so every chunk
+# encodes to whole 76-character base64 lines
+ATTACHMENT_READ_SIZE = 57 * 1024
+
+
+class RateLimiter:
+    """Token bucket shared by every SMTP connection of one delivery run"""
+
+    def __init__(self, per_minute):
+        self.per_minute = per_minute
+        self.tokens = float(per_minute)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, count=1):
+        if not self.per_minute:
+            return
+        # The bucket never holds more than per_minute, so a larger count is
+        # paid in rounds, each waiting for a refill
+        while count > 0:
+            self._take(min(count, self.per_minute))
+            count -= self.per_minute
+
+    def _take(self, count):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.per_minute, self.tokens + (now - self.updated) * self.per_minute / 60)
+                self.updated = now
+                if self.tokens >= count:
+                    self.tokens -= count
+                    return
+                wait = (count - self.tokens) * 60 / self.per_minute
+            time.sleep(wait)
+
+
+def build_pdf_attachment(path, filename, storage=None):
+    """Base64-encode a file (local, or a name in storage) once, chunk by chunk, into a reusable MIME part"""
+    encoded = []
+    with (storage.open(path, 'rb') if storage else open(path, 'rb')) as f:
+        for chunk in iter(lambda: f.read(ATTACHMENT_READ_SIZE), b''):
+            encoded.append(base64.encodebytes(chunk).decode('ascii'))
+
+    part = MIMEBase('application', 'pdf')
+    part.set_payload(''.join(encoded))
+    part['Content-Transfer-Encoding'] = 'base64'
+    part.add_header('Content-Disposition', 'attachment', filename=filename)
+    return part
+
+
+def chunk_recipients(recipients, size):
+    for start in range(0, len(recipients), size):
+        yield recipients[start:start + size]
+
+
+def build_messages(subject, body, recipients, attachments=(), from_email=None, chunk_size=None, mode=None):
+    """Split recipients into messages: one BCC message per chunk, or one message per recipient"""
+    from_email = from_email or settings.EMAIL_HOST_USER
+    chunk_size = max(1, chunk_size or getattr(settings, 'NOTIFICATION_CHUNK_SIZE', 50))
+    mode = mode or getattr(settings, 'NOTIFICATION_RECIPIENT_MODE', 'bcc')
+
+    if mode == 'individual':
+        groups = ([recipient] for recipient in recipients)
+    elif mode == 'bcc':
+        groups = chunk_recipients(recipients, chunk_size)
+    else:
+        raise ValueError(f"Unknown notification recipient mode: {mode}")
+
+    messages = []
+    for group in groups:
+        if mode == 'individual':
+            message = EmailMessage(subject=subject, body=body, from_email=from_email, to=group)
+        else:
+            message = EmailMessage(subject=subject, body=body, from_email=from_email, bcc=group)
+        for attachment in attachments:
+            message.attach(attachment)
+        messages.append(message)
+    return messages
+
+
+def send_bulk_email(subject, body, recipients, attachments=(), from_email=None, fail_silently=False,
+                    chunk_size=None, mode=None, connections=None, rate_per_minute=None, on_sent=None):
+    """Deliver one email to many recipients over a small pool of reused SMTP connections.
+
+    Recipients are chunked per NOTIFICATION_CHUNK_SIZE/NOTIFICATION_RECIPIENT_MODE
+    (chunks no larger than the rate), messages are spread across
+    NOTIFICATION_SMTP_CONNECTIONS open connections and the whole run is
+    throttled to NOTIFICATION_RATE_PER_MINUTE recipients. on_sent, if given,
+    is called with the recipients of each message once it has been accepted.
+    Returns the number of messages sent.
+    """
+    rate_per_minute = rate_per_minute if rate_per_minute is not None else getattr(settings, 'NOTIFICATION_RATE_PER_MINUTE', 0)
+    chunk_size = chunk_size or getattr(settings, 'NOTIFICATION_CHUNK_SIZE', 50)
+    if rate_per_minute:
+        # A BCC message to more recipients than the rate allows per minute
+        # would go over the provider's limit however long it waited
+        chunk_size = min(chunk_size, rate_per_minute)
+    messages = build_messages(subject, body, recipients, attachments, from_email, chunk_size, mode)
+    if not messages:
+        return 0
+
+    pool_size = connections or getattr(settings, 'NOTIFICATION_SMTP_CONNECTIONS', 1)
+    pool_size = max(1, min(pool_size, len(messages)))
+    limiter = RateLimiter(rate_per_minute)
+
+    def deliver(batch):
+        sent = 0
+        with get_connection(fail_silently=fail_silently) as smtp:
+            for message in batch:
+                limiter.acquire(len(message.recipients()))
+                delivered = smtp.send_messages([message]) or 0
+                if delivered and on_sent:
+                    on_sent(message.recipients())
+                sent += delivered
+        return sent
+
+    batches = [messages[i::pool_size] for i in range(pool_size)]
+    if pool_size == 1:
+        return deliver(batches[0])
+
+    with ThreadPoolExecutor(max_workers=pool_size) as pool:
+        return sum(pool.map(deliver, batches))
+
+
+def send_upload_notification(college, branch, semester, doc_type, title, subject, uploaded_by, file_path, fail_silently=True,
+                             exclude=(), on_sent=None):
+    """Send email notification to students about new upload with PDF attachment
+
+    Addresses in exclude are skipped; on_sent is passed to send_bulk_email.
+    """
+    try:
+        # Get students who want notifications for this specific college, branch, and semester
+        recipient_emails = list(StudentNotification.objects.filter(
+            college=college,
+            branch=branch,
+            semester=semester,
+            wants_notifications=True
+        ).values_list('email', flat=True).distinct())
+        if exclude:
+            exclude = set(exclude)
+            recipient_emails = [email for email in recipient_emails if email not in exclude]
+
+        if not recipient_emails:
+            return 0  # No students to notify
+
+        # Prepare email content
+        doc_type_names = {
+            'notes': 'Notes',
+            'syllabus': 'Syllabus',
+            'midterm': 'Midterm Papers',
+            'model': 'Model Papers'
+        }
+
+        branch_names = {
+            'cse': 'Computer Science & Engineering',
+            'civil': 'Civil Engineering',
+            'auto': 'Automobile Engineering',
+            'eee': 'Electrical & Electronics Engineering',
+            'ece': 'Electronics & Communication Engineering',
+            'ist': 'Information Science & Technology',
+            'ice': 'Instrumentation & Control Engineering',
+            'mech': 'Mechanical Engineering',
+        }
+
+        college_names = {
+            'meip': 'MEIP',
+            'pvp': 'PVP',
+            'sjp': 'SJP',
+            'rrp': 'RRP',
+        }
+
+        email_subject = f"📚 New {doc_type_names.get(doc_type)} Uploaded - {branch_names.get(branch)}"
+
+        # Create download link
+        download_link = f"http://127.0.0.1:8000/media/{file_path}"
+
+        email_message = f"""
+Hello Student,
+
+A new document has been uploaded to {college_names.get(college)} College:
+
+📓 Type: {doc_type_names.get(doc_type)}
+📝 Title: {title}
+📚 Subject: {subject}
+🏫 Branch: {branch_names.get(branch)}
+📅 Semester: {semester}
+👨‍🏫 Uploaded by: {uploaded_by.title()}
+
+📥 Download Link: {download_link}
+
+The PDF is also attached to this email for your convenience.
+
+Happy Learning!
+Question Papers Hub Team
+        """
+
+        # Encode the PDF once and share the MIME part across every chunk
+        attachments = []
+        try:
+            file_size = default_storage.size(file_path)
+
+            if file_size < getattr(settings, 'NOTIFICATION_MAX_ATTACHMENT_SIZE', 5242880):
+                attachments.append(build_pdf_attachment(file_path, os.path.basename(file_path), storage=default_storage))
+                print(f"✅ PDF attached to email (Size: {file_size / 1024:.2f} KB)")
+            else:
+                print(f"⚠️ PDF too large to attach ({file_size / 1024 / 1024:.2f} MB), download link provided")
+        except Exception as e:
+            print(f"⚠️ Could not attach PDF: {str(e)}")
+
+        sent = send_bulk_email(
+            subject=email_subject,
+            body=email_message,
+            recipients=recipient_emails,
+            attachments=attachments,
+            fail_silently=fail_silently,
+            on_sent=on_sent,
+        )
+
+        print(f"✅ Notification sent to {len(recipient_emails)} students in {sent} message(s)")
+        return sent
+
+    except Exception as e:
+        print(f"❌ Email notification failed: {str(e)}")
+        if not fail_silently:
+            raise
+        return 0
+
+
+def queue_upload_notification(paper):
+    """Record an outbox entry for a new upload; call inside the upload's transaction"""
+    return NotificationOutbox.objects.create(
+        paper=paper,
+        college=paper.college,
+        branch=paper.branch,
+        semester=paper.semester,
+        doc_type=paper.doc_type,
+        title=paper.title,
+        subject=paper.subject,
+        uploaded_by=paper.uploaded_by or '',
+        file_path=paper.file.name,
+    )
+
+
+def claim_notifications(batch_size=20, worker_id=None, stale_after=600):
+    """Claim up to batch_size pending outbox entries for this worker.
+
+    The claim is a conditional UPDATE on status, so when several workers race
+    for the same rows only one of them wins each row. Entries left in
+    'processing' by a crashed worker become claimable again after stale_after
+    seconds.
+    """
+    worker_id = worker_id or uuid.uuid4().hex
+    now = timezone.now()
+    stale_before = now - timedelta(seconds=stale_after)
+
+    claimable = (
+        Q(status='pending') |
+        Q(status='processing', claimed_at__lt=stale_before)
+    )
+
+    with transaction.atomic():
+        candidates = NotificationOutbox.objects.filter(claimable).order_by('created_at')
+        if connection.features.has_select_for_update_skip_locked:
+            candidates = candidates.select_for_update(skip_locked=True)
+        ids = list(candidates.values_list('id', flat=True)[:batch_size])
+        if not ids:
+            return []
+
+        NotificationOutbox.objects.filter(claimable, id__in=ids).update(
+            status='processing',
+            claimed_by=worker_id,
+            claimed_at=now,
+        )
+
+    return list(NotificationOutbox.objects.filter(
+        id__in=ids,
+        status='processing',
+        claimed_by=worker_id,
+    ))
+
+
+def process_notification(entry, max_attempts=5):
+    """Deliver a claimed outbox entry and record the outcome
+
+    Recipients already reached by an earlier attempt are kept in delivered_to
+    and skipped, so a retry after a partial failure only sends the rest.
+    """
+    entry.attempts += 1
+    delivered = set(entry.delivered_to.split())
+    sent_to = []
+    try:
+        send_upload_notification(
+            college=entry.college,
+            branch=entry.branch,
+            semester=entry.semester,
+            doc_type=entry.doc_type,
+            title=entry.title,
+            subject=entry.subject,
+            uploaded_by=entry.uploaded_by,
+            file_path=entry.file_path,
+            fail_silently=False,
+            exclude=delivered,
+            on_sent=sent_to.extend,
+        )
+    except Exception as e:
+        entry.delivered_to = '\n'.join(sorted(delivered.union(sent_to)))
+        entry.last_error = str(e)
+        entry.status = 'failed' if entry.attempts >= max_attempts else 'pending'
+        entry.claimed_by = ''
+        entry.claimed_at = None
+        entry.save(update_fields=['attempts', 'delivered_to', 'last_error', 'status', 'claimed_by', 'claimed_at'])
+        return False
+
+    entry.delivered_to = '\n'.join(sorted(delivered.union(sent_to)))
+    entry.status = 'sent'
+    entry.sent_at = timezone.now()
+    entry.last_error = ''
+    entry.save(update_fields=['attempts', 'delivered_to', 'last_error', 'status', 'sent_at'])
+    return True
+
+
+def process_outbox(batch_size=20, worker_id=None, max_attempts=5, stale_after=600):
+    """Claim and deliver one batch; returns the number of entries handled"""
+    entries = claim_notifications(batch_size=batch_size, worker_id=worker_id, stale_after=stale_after)
+    for entry in entries:
+        process_notification(entry, max_attempts=max_attempts)
+    return len(entries)
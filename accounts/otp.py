@@ -0,0 +1,191 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.mail import get_connection, send_mail
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import OTPVerification
+
+
+# Results of verify() on either store
+OTP_VALID = 'valid'
+OTP_INVALID = 'invalid'
+OTP_EXPIRED = 'expired'
+OTP_MISSING = 'missing'
+
+
+class DatabaseOTPStore:
+    """OTPs as OTPVerification rows; only the latest unverified one per email is kept"""
+
+    def issue(self, email):
+        otp = OTPVerification.generate_otp()
+        with transaction.atomic():
+            OTPVerification.objects.filter(email=email, is_verified=False).delete()
+            OTPVerification.objects.create(email=email, otp=otp)
+        return otp
+
+    def verify(self, email, otp):
+        otp_obj = OTPVerification.objects.filter(email=email, is_verified=False).order_by('-created_at').first()
+        if otp_obj is None:
+            return OTP_MISSING
+        if not otp_obj.is_valid():
+            return OTP_EXPIRED
+        if otp_obj.otp != otp:
+            return OTP_INVALID
+        # Conditional update so a code can only be used once
+        if not OTPVerification.objects.filter(pk=otp_obj.pk, is_verified=False).update(is_verified=True):
+            return OTP_MISSING
+        return OTP_VALID
+
+
+class CacheOTPStore:
+    """OTPs kept only in the cache, expiring on their own"""
+
+    def _key(self, email):
+        return f"otp:{email.lower()}"
+
+    def issue(self, email):
+        otp = OTPVerification.generate_otp()
+        # Kept past the validity window so a late attempt reports 'expired'
+        cache.set(
+            self._key(email),
+            {'otp': otp, 'created_at': timezone.now()},
+            int(OTPVerification.VALIDITY.total_seconds()) * 2,
+        )
+        return otp
+
+    def verify(self, email, otp):
+        key = self._key(email)
+        entry = cache.get(key)
+        if entry is None:
+            return OTP_MISSING
+        if timezone.now() >= entry['created_at'] + OTPVerification.VALIDITY:
+            return OTP_EXPIRED
+        if entry['otp'] != otp:
+            return OTP_INVALID
+        # Only the caller that actually removes the entry may use the code;
+        # a concurrent verify that read it too gets False here
+        if not cache.delete(key):
+            return OTP_MISSING
+        return OTP_VALID
+
+
+OTP_STORES = {
+    'database': DatabaseOTPStore,
+    'cache': CacheOTPStore,
+}
+
+
+def get_otp_store():
+    store = getattr(settings, 'OTP_STORE', 'database')
+    try:
+        return OTP_STORES[store]()
+    except KeyError:
+        raise ValueError(f"Unknown OTP store: {store}")
+
+
+def purge_otps(batch_size=1000):
+    """Delete verified and expired OTPVerification rows in batches; returns the number deleted"""
+    stale = Q(is_verified=True) | Q(created_at__lt=timezone.now() - OTPVerification.VALIDITY)
+    deleted = 0
+    while True:
+        ids = list(OTPVerification.objects.filter(stale).order_by().values_list('id', flat=True)[:batch_size])
+        if not ids:
+            return deleted
+        deleted += OTPVerification.objects.filter(id__in=ids).delete()[0]
+
+
+class CircuitBreaker:
+    """Fails fast after failure_threshold consecutive failures.
+
+    While open, one trial call is let through every reset_timeout seconds; a
+    success closes the circuit again.
+    """
+
+    def __init__(self, failure_threshold, reset_timeout):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.lock = threading.Lock()
+
+    def allow(self):
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+# OTP mail state for this process
+otp_mail_breaker = CircuitBreaker(
+    getattr(settings, 'OTP_EMAIL_FAILURE_THRESHOLD', 3),
+    getattr(settings, 'OTP_EMAIL_RESET_TIMEOUT', 30),
+)
+_executor = None
+_executor_lock = threading.Lock()
+_pending = 0
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, 'OTP_EMAIL_WORKERS', 4),
+                thread_name_prefix='otp-mail',
+            )
+        return _executor
+
+
+def otp_email_available():
+    """False while SMTP is failing or the mail queue is backed up"""
+    return _pending < getattr(settings, 'OTP_EMAIL_MAX_PENDING', 50) and otp_mail_breaker.allow()
+
+
+def _deliver_otp_email(email, otp):
+    global _pending
+    try:
+        send_mail(
+            subject='Your Login OTP',
+            message=f'Your OTP for login is: {otp}\n\nThis OTP is valid for 10 minutes.',
+            from_email=settings.EMAIL_HOST_USER,
+            recipient_list=[email],
+            connection=get_connection(timeout=getattr(settings, 'OTP_EMAIL_TIMEOUT', 10)),
+        )
+        otp_mail_breaker.record_success()
+    except Exception as e:
+        otp_mail_breaker.record_failure()
+        print(f"❌ Failed to send OTP to {email}: {str(e)}")
+    finally:
+        with _executor_lock:
+            _pending -= 1
+
+
+def send_otp_email(email, otp):
+    """Send the OTP email on the mail thread pool, or inline with OTP_EMAIL_WORKERS = 0"""
+    global _pending
+    with _executor_lock:
+        _pending += 1
+    if not getattr(settings, 'OTP_EMAIL_WORKERS', 4):
+        _deliver_otp_email(email, otp)
+        return None
+    return _get_executor().submit(_deliver_otp_email, email, otp)
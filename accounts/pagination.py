@@ -0,0 +1,59 @@
+import base64
+from datetime import datetime
+
+from django.db.models import Q
+
+
+def encode_cursor(paper):
+    """Opaque cursor for a paper's position in the (uploaded_at, id) ordering"""
+    raw = f"{paper.uploaded_at.isoformat()}|{paper.pk}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Return (uploaded_at, id) for a cursor, or None if it is missing or malformed"""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        uploaded_at, pk = raw.split('|')
+        return datetime.fromisoformat(uploaded_at), int(pk)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def keyset_page(queryset, after=None, before=None, page_size=20):
+    """Fetch one page of papers, newest first, seeking from a cursor instead of using OFFSET.
+
+    ``after`` pages towards older papers, ``before`` towards newer ones. Each
+    page is a single indexed range scan of page_size + 1 rows, so deep pages
+    cost the same as the first one.
+    """
+    after = decode_cursor(after)
+    before = decode_cursor(before)
+
+    if before:
+        uploaded_at, pk = before
+        rows = list(queryset.filter(
+            Q(uploaded_at__gt=uploaded_at) | Q(uploaded_at=uploaded_at, id__gt=pk)
+        ).order_by('uploaded_at', 'id')[:page_size + 1])
+        has_newer = len(rows) > page_size
+        papers = rows[:page_size][::-1]
+        has_older = True
+    else:
+        queryset = queryset.order_by('-uploaded_at', '-id')
+        if after:
+            uploaded_at, pk = after
+            queryset = queryset.filter(
+                Q(uploaded_at__lt=uploaded_at) | Q(uploaded_at=uploaded_at, id__lt=pk)
+            )
+        rows = list(queryset[:page_size + 1])
+        has_older = len(rows) > page_size
+        papers = rows[:page_size]
+        has_newer = after is not None
+
+    return {
+        'papers': papers,
+        'next_cursor': encode_cursor(papers[-1]) if papers and has_older else None,
+        'prev_cursor': encode_cursor(papers[0]) if papers and has_newer else None,
+    }
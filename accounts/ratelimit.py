@@ -0,0 +1,73 @@
+import hashlib
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.backends.redis import RedisCache
+
+
+def client_ip(request):
+    if getattr(settings, 'RATE_LIMIT_TRUST_X_FORWARDED_FOR', False):
+        forwarded = request.META.get('HTTP_X_FORWARDED_FOR', '')
+        if forwarded:
+            return forwarded.split(',')[0].strip()
+    return request.META.get('REMOTE_ADDR', '')
+
+
+# GCRA in one step on Redis: the stored value is the time the bucket is full again
+GCRA_SCRIPT = """
+local now = tonumber(ARGV[1])
+local ready_at = math.max(tonumber(redis.call('GET', KEYS[1]) or 0), now) + tonumber(ARGV[2])
+if ready_at - now > tonumber(ARGV[3]) then
+    return 0
+end
+redis.call('SET', KEYS[1], tostring(ready_at), 'PX', math.ceil((ready_at - now) * 1000))
+return 1
+"""
+
+# For caches private to this process (locmem in development), where a
+# process-wide lock is enough
+_lock = threading.Lock()
+
+
+def take_token(key, capacity, period):
+    """Take a token from a bucket of capacity tokens refilled over period seconds.
+
+    Stored in the shared cache as a single timestamp (GCRA), so every worker
+    shares the bucket. The read-compute-write is atomic: a Lua script on
+    Redis, the file lock of accounts.cache.FileBasedCache, or a process lock
+    for other (per-process) caches, so a burst cannot get past the limit.
+    """
+    # The tiered default cache keeps these keys in its shared tier anyway
+    backend = getattr(cache, 'shared', cache)
+    cache_key = 'ratelimit:' + hashlib.sha1(key.encode()).hexdigest()
+    interval = period / capacity
+
+    if isinstance(backend, RedisCache):
+        redis_key = backend.make_and_validate_key(cache_key)
+        client = backend._cache.get_client(redis_key, write=True)
+        return bool(client.eval(GCRA_SCRIPT, 1, redis_key, repr(time.time()), repr(interval), repr(period)))
+
+    lock = backend.lock(cache_key) if hasattr(backend, 'lock') else _lock
+    with lock:
+        now = time.time()
+        ready_at = max(backend.get(cache_key, now), now) + interval
+        if ready_at - now > period:
+            return False
+        backend.set(cache_key, ready_at, math.ceil(ready_at - now))
+        return True
+
+
+def allow_otp_request(request, action, email):
+    """Per-IP then per-email token buckets for issuing ('issue') or checking ('verify') OTPs"""
+    ip_capacity, ip_period = getattr(settings, f'OTP_{action.upper()}_RATE_IP', (20, 60 * 60))
+    if not take_token(f'otp:{action}:ip:{client_ip(request)}', ip_capacity, ip_period):
+        return False
+
+    if email:
+        email_capacity, email_period = getattr(settings, f'OTP_{action.upper()}_RATE_EMAIL', (3, 10 * 60))
+        if not take_token(f'otp:{action}:email:{email.strip().lower()}', email_capacity, email_period):
+            return False
+    return True
@@ -0,0 +1,105 @@
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+
+
+# Models whose reads may go to a replica; everything else stays on the primary
+REPLICA_MODELS = {'accounts.QuestionPaper', 'accounts.Internship'}
+
+# Set for the rest of the request (or command) once it writes, and for a
+# while afterwards by ReplicaPinningMiddleware, so reads see those writes
+_pinned = ContextVar('replica_pinned', default=False)
+_wrote = ContextVar('replica_wrote', default=False)
+
+
+def pin_primary():
+    """Read from the primary from now on; called after writes to routed models"""
+    _pinned.set(True)
+    _wrote.set(True)
+
+
+@contextmanager
+def use_primary():
+    """Read from the primary inside the block.
+
+    For reads that fill a shared cache: a lagging replica would otherwise
+    cache data older than the invalidation that triggered the refill.
+    """
+    token = _pinned.set(True)
+    try:
+        yield
+    finally:
+        _pinned.reset(token)
+
+
+def replicas():
+    return getattr(settings, 'DATABASE_REPLICAS', [])
+
+
+class ReplicaRouter:
+    """Spread reads of browse models over DATABASE_REPLICAS; all writes go to the primary"""
+
+    def db_for_read(self, model, **hints):
+        if model._meta.label not in REPLICA_MODELS or not replicas():
+            return None
+        instance = hints.get('instance')
+        if instance is not None and instance._state.db:
+            # Related lookups stay on the database the object came from
+            return instance._state.db
+        if _pinned.get() or connections['default'].in_atomic_block:
+            return 'default'
+        return random.choice(replicas())
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {'default', *replicas()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas get their schema from the primary through replication
+        if db in replicas():
+            return False
+        return None
+
+
+class ReplicaPinningMiddleware:
+    """Read-your-writes across requests when reads go to replicas.
+
+    A request that writes a routed model sets a short-lived cookie; while it
+    is present, this browser's reads go to the primary, which gives the
+    replicas REPLICA_PIN_SECONDS to catch up.
+    """
+
+    cookie_name = 'primary_until'
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not replicas():
+            return self.get_response(request)
+
+        try:
+            pinned = float(request.COOKIES.get(self.cookie_name, 0)) > time.time()
+        except ValueError:
+            pinned = False
+
+        pinned_token = _pinned.set(pinned)
+        wrote_token = _wrote.set(False)
+        try:
+            response = self.get_response(request)
+            if _wrote.get():
+                seconds = getattr(settings, 'REPLICA_PIN_SECONDS', 10)
+                response.set_cookie(self.cookie_name, str(int(time.time() + seconds)), max_age=seconds, httponly=True, samesite='Lax')
+        finally:
+            _pinned.reset(pinned_token)
+            _wrote.reset(wrote_token)
+        return response
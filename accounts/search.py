@@ -0,0 +1,167 @@
+import re
+
+from django.db import connection
+from django.db.models import Q
+
+from .models import QuestionPaper
+
+
+# Words matched per query; the rest of a long query is ignored
+MAX_SEARCH_TERMS = 8
+
+FTS_TABLE = 'accounts_questionpaper_fts'
+FTS_VIEW = 'accounts_questionpaper_search'
+
+
+def _fts_delete(paper_id):
+    return (
+        f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, subject, body) "
+        f"SELECT 'delete', id, title, subject, body FROM {FTS_VIEW} WHERE id = {paper_id};"
+    )
+
+
+def _fts_insert(paper_id):
+    return (
+        f"INSERT INTO {FTS_TABLE}(rowid, title, subject, body) "
+        f"SELECT id, title, subject, body FROM {FTS_VIEW} WHERE id = {paper_id};"
+    )
+
+
+# SQLite: FTS5 table over title, subject and extracted PDF text, with a view
+# joining papers to their text as its external content. Triggers on both
+# tables take a paper's old row out of the index before a change and put the
+# new one back after it. SQLite rebuilds a table on most AlterField/AddField
+# migrations, which fails while the view refers to it and would drop the
+# triggers, so such migrations must drop the index before and install it
+# after, from a copy of the SQL frozen in a migration (see 0020); a change to
+# the SQL here needs a migration of its own. `manage.py rebuild_search_index`
+# reinstalls it by hand.
+SQLITE_TRIGGERS = [
+    ('paper_ai', 'AFTER INSERT ON accounts_questionpaper', _fts_insert('new.id')),
+    ('paper_bu', 'BEFORE UPDATE OF title, subject ON accounts_questionpaper', _fts_delete('old.id')),
+    ('paper_au', 'AFTER UPDATE OF title, subject ON accounts_questionpaper', _fts_insert('new.id')),
+    ('paper_bd', 'BEFORE DELETE ON accounts_questionpaper', _fts_delete('old.id')),
+    ('text_bi', 'BEFORE INSERT ON accounts_papertext', _fts_delete('new.paper_id')),
+    ('text_ai', 'AFTER INSERT ON accounts_papertext', _fts_insert('new.paper_id')),
+    ('text_bu', 'BEFORE UPDATE ON accounts_papertext', _fts_delete('old.paper_id')),
+    ('text_au', 'AFTER UPDATE ON accounts_papertext', _fts_insert('new.paper_id')),
+    ('text_bd', 'BEFORE DELETE ON accounts_papertext', _fts_delete('old.paper_id')),
+    ('text_ad', 'AFTER DELETE ON accounts_papertext', _fts_insert('old.paper_id')),
+]
+
+SQLITE_INDEX_SQL = [
+    f"""CREATE VIEW IF NOT EXISTS {FTS_VIEW} AS
+        SELECT p.id, p.title, p.subject, coalesce(t.content, '') AS body
+        FROM accounts_questionpaper p LEFT JOIN accounts_papertext t ON t.paper_id = p.id""",
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, subject, body,
+        content='{FTS_VIEW}', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )""",
+] + [
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_{name} {event} BEGIN {body} END"
+    for name, event, body in SQLITE_TRIGGERS
+] + [
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+
+SQLITE_DROP_SQL = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_{name}" for name, _, _ in SQLITE_TRIGGERS
+] + [
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+    f"DROP VIEW IF EXISTS {FTS_VIEW}",
+]
+
+# PostgreSQL: expression GIN indexes on papers and on their text; queries
+# must repeat the expressions exactly for the planner to use them. Title
+# matches rank above subject ones, and both above matches in the text.
+PG_DOCUMENT = "(setweight(to_tsvector('simple', title), 'A') || setweight(to_tsvector('simple', subject), 'B'))"
+PG_TEXT_DOCUMENT = "to_tsvector('simple', content)"
+
+PG_INDEX_SQL = [
+    f"CREATE INDEX IF NOT EXISTS paper_search_idx ON accounts_questionpaper USING GIN ({PG_DOCUMENT})",
+    f"CREATE INDEX IF NOT EXISTS paper_text_search_idx ON accounts_papertext USING GIN ({PG_TEXT_DOCUMENT})",
+]
+
+PG_DROP_SQL = [
+    "DROP INDEX IF EXISTS paper_search_idx",
+    "DROP INDEX IF EXISTS paper_text_search_idx",
+]
+
+
+def install_search_index(schema_editor):
+    vendor = schema_editor.connection.vendor
+    for sql in {'sqlite': SQLITE_INDEX_SQL, 'postgresql': PG_INDEX_SQL}.get(vendor, []):
+        schema_editor.execute(sql)
+
+
+def remove_search_index(schema_editor):
+    vendor = schema_editor.connection.vendor
+    for sql in {'sqlite': SQLITE_DROP_SQL, 'postgresql': PG_DROP_SQL}.get(vendor, []):
+        schema_editor.execute(sql)
+
+
+def search_terms(query):
+    return re.findall(r'\w+', query.lower())[:MAX_SEARCH_TERMS]
+
+
+def _filter_sql(filters):
+    clauses = []
+    params = []
+    for field, value in filters.items():
+        if value not in (None, ''):
+            clauses.append(f'p.{field} = %s')
+            params.append(value)
+    return ''.join(f' AND {clause}' for clause in clauses), params
+
+
+def search_paper_ids(terms, filters, limit):
+    """Ids of papers matching every term (as a prefix), best match first"""
+    where, params = _filter_sql(filters)
+
+    if connection.vendor == 'sqlite':
+        match = ' '.join(f'"{term}"*' for term in terms)
+        sql = (
+            f"SELECT p.id FROM {FTS_TABLE} JOIN accounts_questionpaper p ON p.id = {FTS_TABLE}.rowid "
+            f"WHERE {FTS_TABLE} MATCH %s{where} "
+            f"ORDER BY bm25({FTS_TABLE}, 4.0, 2.0, 1.0), p.uploaded_at DESC LIMIT %s"
+        )
+        params = [match] + params + [limit]
+    elif connection.vendor == 'postgresql':
+        # Each index answers for its own table: papers matching on title and
+        # subject, or on their text
+        tsquery = ' & '.join(f'{term}:*' for term in terms)
+        sql = (
+            f"WITH hits AS ("
+            f"SELECT id FROM accounts_questionpaper WHERE {PG_DOCUMENT} @@ to_tsquery('simple', %s) "
+            f"UNION SELECT paper_id FROM accounts_papertext WHERE {PG_TEXT_DOCUMENT} @@ to_tsquery('simple', %s)"
+            f") "
+            f"SELECT p.id FROM hits JOIN accounts_questionpaper p ON p.id = hits.id "
+            f"LEFT JOIN accounts_papertext t ON t.paper_id = p.id "
+            f"WHERE TRUE{where} "
+            f"ORDER BY ts_rank({PG_DOCUMENT} || setweight(to_tsvector('simple', coalesce(t.content, '')), 'C'), "
+            f"to_tsquery('simple', %s)) DESC, p.uploaded_at DESC LIMIT %s"
+        )
+        params = [tsquery, tsquery] + params + [tsquery, limit]
+    else:
+        # No full-text index on other databases: fall back to substring matching
+        queryset = QuestionPaper.objects.filter(**{field: value for field, value in filters.items() if value not in (None, '')})
+        for term in terms:
+            queryset = queryset.filter(Q(title__icontains=term) | Q(subject__icontains=term) | Q(text__content__icontains=term))
+        return list(queryset.order_by('-uploaded_at').values_list('id', flat=True)[:limit])
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [row[0] for row in cursor.fetchall()]
+
+
+def search_papers(query, college, branch=None, semester=None, doc_type=None, year=None, limit=50):
+    """Papers of a college whose title, subject or text match query, ranked, with optional filters"""
+    terms = search_terms(query)
+    if not terms:
+        return []
+
+    filters = {'college': college, 'branch': branch, 'semester': semester, 'doc_type': doc_type, 'year': year}
+    ids = search_paper_ids(terms, filters, limit)
+    papers = QuestionPaper.objects.in_bulk(ids)
+    return [papers[paper_id] for paper_id in ids if paper_id in papers]
@@ -0,0 +1,103 @@
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .blobs import release_blob
+from .internships import invalidate_internships
+from .listings import invalidate_listing
+from .models import Internship, QuestionPaper
+from .routers import pin_primary
+
+
+@receiver(pre_save, sender=QuestionPaper)
+def remember_paper_listing(sender, instance, **kwargs):
+    # An edit (e.g. in admin) may move a paper to another listing; remember
+    # the old one so both get invalidated
+    instance._previous_listing = None
+    instance._replaced_thumbnail = ''
+    if instance.pk:
+        previous = (
+            QuestionPaper.objects.filter(pk=instance.pk)
+            .values_list('college', 'branch', 'semester', 'file', 'thumbnail')
+            .first()
+        )
+        if previous:
+            instance._previous_listing = previous[:3]
+            # A replaced file needs its text and thumbnail again; unchanged
+            # files keep theirs
+            if previous[3] != instance.file.name:
+                instance.text_status = 'pending'
+                instance.processing_started_at = None
+                instance.thumbnail = ''
+                instance._replaced_thumbnail = previous[4]
+
+
+def delete_unused_thumbnail(name):
+    # Papers with the same content share a thumbnail
+    if name:
+        transaction.on_commit(
+            lambda: QuestionPaper.objects.filter(thumbnail=name).exists() or default_storage.delete(name)
+        )
+
+
+@receiver(post_save, sender=QuestionPaper)
+def delete_replaced_thumbnail(sender, instance, **kwargs):
+    delete_unused_thumbnail(getattr(instance, '_replaced_thumbnail', ''))
+
+
+@receiver(post_save, sender=QuestionPaper)
+@receiver(post_delete, sender=QuestionPaper)
+def invalidate_paper_listing(sender, instance, **kwargs):
+    listings = {(instance.college, instance.branch, instance.semester)}
+    previous = getattr(instance, '_previous_listing', None)
+    if previous:
+        listings.add(previous)
+
+    # Invalidate after commit so a concurrent reader cannot re-cache the
+    # listing from a snapshot that does not yet contain this change
+    def invalidate():
+        for listing in listings:
+            invalidate_listing(*listing)
+
+    transaction.on_commit(invalidate)
+
+
+@receiver(post_save, sender=QuestionPaper)
+@receiver(post_delete, sender=QuestionPaper)
+@receiver(post_save, sender=Internship)
+@receiver(post_delete, sender=Internship)
+def pin_reads_to_primary(sender, instance, **kwargs):
+    # Replicas may not have this change yet
+    pin_primary()
+
+
+@receiver(post_delete, sender=QuestionPaper)
+def release_paper_blob(sender, instance, **kwargs):
+    if instance.blob_id:
+        release_blob(instance.blob_id)
+
+
+@receiver(post_delete, sender=QuestionPaper)
+def delete_paper_thumbnail(sender, instance, **kwargs):
+    delete_unused_thumbnail(instance.thumbnail)
+
+
+@receiver(pre_save, sender=Internship)
+def remember_internship_branch(sender, instance, **kwargs):
+    instance._previous_branch = None
+    if instance.pk:
+        instance._previous_branch = (
+            Internship.objects.filter(pk=instance.pk).values_list('branch', flat=True).first()
+        )
+
+
+@receiver(post_save, sender=Internship)
+@receiver(post_delete, sender=Internship)
+def invalidate_internship_listing(sender, instance, **kwargs):
+    branches = {instance.branch}
+    previous = getattr(instance, '_previous_branch', None)
+    if previous:
+        branches.add(previous)
+
+    transaction.on_commit(lambda: invalidate_internships(*branches))
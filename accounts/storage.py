@@ -0,0 +1,186 @@
+import hashlib
+import hmac
+import mimetypes
+import os
+import shutil
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+from urllib.parse import quote, urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import File
+from django.core.files.storage import Storage
+from django.utils.deconstruct import deconstructible
+from django.utils.http import content_disposition_header
+
+from .diskcache import DiskCache
+
+try:
+    from google.api_core.exceptions import NotFound
+except ImportError:
+    NotFound = FileNotFoundError
+
+
+class LocalBlob:
+    """The part of google.cloud.storage.Blob that FirebaseStorage uses, backed by a local file"""
+
+    def __init__(self, bucket, name):
+        self.bucket = bucket
+        self.name = name
+        self.size = None
+        self.updated = None
+
+    @property
+    def path(self):
+        return os.path.join(self.bucket.root, self.name)
+
+    def exists(self):
+        return os.path.isfile(self.path)
+
+    def reload(self):
+        stat = os.stat(self.path)
+        self.size = stat.st_size
+        self.updated = datetime.fromtimestamp(stat.st_mtime, tz=dt_timezone.utc)
+
+    def upload_from_file(self, file_obj, rewind=False, content_type=None):
+        if rewind:
+            file_obj.seek(0)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path + '.upload', 'wb') as f:
+            shutil.copyfileobj(file_obj, f)
+        os.replace(self.path + '.upload', self.path)
+        self.reload()
+
+    def open(self, mode='rb'):
+        return open(self.path, mode)
+
+    def download_to_file(self, file_obj):
+        with open(self.path, 'rb') as f:
+            shutil.copyfileobj(f, file_obj)
+
+    def delete(self):
+        os.remove(self.path)
+
+    def generate_signed_url(self, expiration, version='v4', method='GET', response_disposition=None):
+        expires = int(time.time() + expiration.total_seconds())
+        signature = hmac.new(
+            settings.SECRET_KEY.encode(),
+            f"{method}:{self.name}:{expires}:{response_disposition or ''}".encode(),
+            hashlib.sha256,
+        ).hexdigest()
+        params = {'expires': expires, 'signature': signature}
+        if response_disposition:
+            params['response-content-disposition'] = response_disposition
+        return f"{self.bucket.base_url}{quote(self.name)}?{urlencode(params)}"
+
+
+class LocalBucket:
+    """Filesystem stand-in for the Firebase bucket so tests and local development run offline"""
+
+    name = 'local'
+
+    def __init__(self, root, base_url=None):
+        self.root = str(root)
+        self.base_url = base_url or f"{settings.MEDIA_URL}bucket/"
+
+    def blob(self, name):
+        return LocalBlob(self, name)
+
+    def get_blob(self, name):
+        blob = self.blob(name)
+        if not blob.exists():
+            return None
+        blob.reload()
+        return blob
+
+
+@deconstructible
+class FirebaseStorage(Storage):
+    """Stores files in the Firebase Storage bucket and serves them through short-lived signed URLs.
+
+    Enabled with PAPER_STORAGE=firebase. fake_bucket_root swaps the bucket for
+    a LocalBucket in that directory. Reads go through a local DiskCache when
+    PAPER_CACHE_DIR is set.
+    """
+
+    def __init__(self, bucket=None, fake_bucket_root=None, signed_url_expiry=None, cache_dir=None, cache_max_size=None):
+        self._bucket = bucket
+        self.fake_bucket_root = fake_bucket_root
+        self.signed_url_expiry = signed_url_expiry
+        cache_dir = cache_dir or getattr(settings, 'PAPER_CACHE_DIR', None)
+        self.disk_cache = None
+        if cache_dir:
+            self.disk_cache = DiskCache(
+                cache_dir,
+                cache_max_size or getattr(settings, 'PAPER_CACHE_MAX_SIZE', 1024 * 1024 * 1024),
+            )
+
+    @property
+    def bucket(self):
+        if self._bucket is None:
+            if self.fake_bucket_root:
+                self._bucket = LocalBucket(self.fake_bucket_root)
+            else:
+                from . import firebase
+                firebase.initialize()
+                self._bucket = firebase.get_storage_bucket()
+        return self._bucket
+
+    def _get_blob(self, name):
+        blob = self.bucket.get_blob(name)
+        if blob is None:
+            raise FileNotFoundError(name)
+        return blob
+
+    def _open(self, name, mode='rb'):
+        if self.disk_cache and mode == 'rb':
+            return File(self.disk_cache.open(name, lambda f: self._get_blob(name).download_to_file(f)), name=name)
+        blob = self._get_blob(name)
+        f = File(blob.open(mode), name=name)
+        f.size = blob.size
+        return f
+
+    def _save(self, name, content):
+        content_type = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+        self.bucket.blob(name).upload_from_file(content, rewind=True, content_type=content_type)
+        return name
+
+    def delete(self, name):
+        if self.disk_cache:
+            self.disk_cache.discard(name)
+        try:
+            self.bucket.blob(name).delete()
+        except (FileNotFoundError, NotFound):
+            pass
+
+    def exists(self, name):
+        return self.bucket.blob(name).exists()
+
+    def size(self, name):
+        size = self.disk_cache.size(name) if self.disk_cache else None
+        if size is not None:
+            return size
+        return self._get_blob(name).size
+
+    def get_modified_time(self, name):
+        return self._get_blob(name).updated
+
+    def url(self, name):
+        return self.signed_url(name)
+
+    def signed_url(self, name, filename=None, as_attachment=False):
+        """V4 signed GET URL, reused from the cache for the first half of its lifetime"""
+        disposition = content_disposition_header(as_attachment, filename) if filename else None
+        key = 'signed_url:' + hashlib.sha1(f"{self.bucket.name}:{name}:{disposition}".encode()).hexdigest()
+        url = cache.get(key)
+        if url is None:
+            expiry = self.signed_url_expiry or getattr(settings, 'FIREBASE_SIGNED_URL_EXPIRY', 15 * 60)
+            url = self.bucket.blob(name).generate_signed_url(
+                expiration=timedelta(seconds=expiry),
+                version='v4',
+                method='GET',
+                response_disposition=disposition,
+            )
+            cache.set(key, url, expiry // 2)
+        return url
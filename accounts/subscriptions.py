@@ -0,0 +1,166 @@
+import atexit
+import json
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.backends.redis import RedisCache
+from django.db import close_old_connections
+
+from .cache import bump_versions, cache_version
+from .models import StudentNotification
+
+
+# Subscriptions viewed and not yet written to the database, with the
+# student's epoch at the time of the view. Kept in the shared cache so a
+# worker that dies before the next flush does not lose them, and so the
+# flush_subscriptions command can write them from another process.
+PENDING_KEY = 'subscription_pending'
+
+# For caches private to this process (locmem in development), where a
+# process-wide lock is enough
+_lock = threading.Lock()
+_flusher = None
+
+
+def _epoch(email):
+    return cache_version(f"subscription_epoch:{email}")
+
+
+def _marker(email, epoch, college, branch, semester):
+    return f"subscription_seen:{email}:{epoch}:{college}:{branch}:{semester}"
+
+
+def _backend():
+    # The tiered default cache keeps this key in its shared tier anyway
+    return getattr(cache, 'shared', cache)
+
+
+def _buffer(entries):
+    """Add entries to the shared buffer"""
+    backend = _backend()
+    members = {json.dumps(list(entry)) for entry in entries}
+    if isinstance(backend, RedisCache):
+        key = backend.make_and_validate_key(PENDING_KEY)
+        backend._cache.get_client(key, write=True).sadd(key, *members)
+        return
+
+    with backend.lock(PENDING_KEY) if hasattr(backend, 'lock') else _lock:
+        pending = backend.get(PENDING_KEY, set())
+        backend.set(PENDING_KEY, pending | members, None)
+
+
+def _drain():
+    """Take every entry out of the shared buffer"""
+    backend = _backend()
+    if isinstance(backend, RedisCache):
+        key = backend.make_and_validate_key(PENDING_KEY)
+        pipe = backend._cache.get_client(key, write=True).pipeline()
+        pipe.smembers(key)
+        pipe.delete(key)
+        members = pipe.execute()[0]
+    else:
+        with backend.lock(PENDING_KEY) if hasattr(backend, 'lock') else _lock:
+            members = backend.get(PENDING_KEY, set())
+            backend.delete(PENDING_KEY)
+    return [tuple(json.loads(member)) for member in members]
+
+
+def record_view(email, college, branch, semester):
+    """Remember that a student viewed a listing, without touching the database.
+
+    Views are buffered in the shared cache and written in bulk by
+    flush_subscriptions(), which then sets a seen marker so repeat views
+    inside SUBSCRIPTION_SEEN_TTL skip the buffer.
+    """
+    epoch = _epoch(email)
+    if cache.get(_marker(email, epoch, college, branch, semester)):
+        return
+
+    _buffer([(email, epoch, college, branch, semester)])
+    _ensure_flusher()
+
+
+def forget_email(email):
+    """Move a student who switched college to a new epoch.
+
+    Views buffered under the old epoch are dropped by flush_subscriptions()
+    instead of recreating the subscriptions the switch deleted; seen markers
+    of the old epoch stop matching.
+    """
+    bump_versions(f"subscription_epoch:{email}")
+
+
+def _stale(entries):
+    epochs = {}
+    for email, epoch, *_ in entries:
+        if email not in epochs:
+            epochs[email] = _epoch(email)
+    return {entry for entry in entries if epochs[entry[0]] != entry[1]}
+
+
+def flush_subscriptions():
+    """Upsert every buffered subscription in one conflict-aware bulk statement"""
+    entries = _drain()
+    if not entries:
+        return 0
+
+    stale = _stale(entries)
+    entries = [entry for entry in entries if entry not in stale]
+    if not entries:
+        return 0
+
+    try:
+        StudentNotification.objects.bulk_create(
+            [
+                StudentNotification(email=email, college=college, branch=branch, semester=semester, wants_notifications=True)
+                for email, _, college, branch, semester in entries
+            ],
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=['email', 'college', 'branch', 'semester'],
+            update_fields=['wants_notifications', 'last_viewed'],
+        )
+    except Exception as e:
+        # Keep the entries for the next flush rather than losing them
+        _buffer(entries)
+        print(f"❌ Subscription flush failed: {str(e)}")
+        return 0
+
+    # A college switch between the check above and the write: take back what
+    # it had already deleted
+    stale = _stale(entries)
+    for email, _, college, branch, semester in stale:
+        StudentNotification.objects.filter(email=email, college=college, branch=branch, semester=semester).delete()
+
+    # Only now that the rows exist may repeat views skip the buffer
+    cache.set_many(
+        {_marker(*entry): True for entry in entries if entry not in stale},
+        getattr(settings, 'SUBSCRIPTION_SEEN_TTL', 60 * 60),
+    )
+    return len(entries)
+
+
+def _flush_loop(stop):
+    interval = getattr(settings, 'SUBSCRIPTION_FLUSH_INTERVAL', 30)
+    while not stop.wait(interval):
+        flush_subscriptions()
+        close_old_connections()
+
+
+def _ensure_flusher():
+    global _flusher
+    if _flusher is not None or not getattr(settings, 'SUBSCRIPTION_FLUSH_INTERVAL', 30):
+        return
+    with _lock:
+        if _flusher is not None:
+            return
+        stop = threading.Event()
+        _flusher = threading.Thread(target=_flush_loop, args=(stop,), name='subscription-flusher', daemon=True)
+        _flusher.start()
+
+    def shutdown():
+        stop.set()
+        flush_subscriptions()
+
+    atexit.register(shutdown)
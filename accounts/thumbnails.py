@@ -0,0 +1,58 @@
+import hashlib
+import io
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+
+def thumbnail_name(digest):
+    """Storage name of the first-page preview of the file with this SHA-256.
+
+    Named after the content and the width, so a new file (or width) gets a
+    new name and an existing thumbnail never goes stale.
+    """
+    width = getattr(settings, 'PAPER_THUMBNAIL_WIDTH', 240)
+    return f"thumbnails/{digest[:2]}/{digest}-{width}.webp"
+
+
+def file_digest(f):
+    hasher = hashlib.sha256()
+    for chunk in iter(lambda: f.read(64 * 1024), b''):
+        hasher.update(chunk)
+    f.seek(0)
+    return hasher.hexdigest()
+
+
+def make_thumbnail(f, digest=None):
+    """Render the first page of an open PDF to a WebP in default_storage; returns its name.
+
+    Rendering is skipped when a thumbnail for the same content already
+    exists. Returns '' when pypdfium2 is not installed.
+    """
+    if pdfium is None:
+        return ''
+    name = thumbnail_name(digest or file_digest(f))
+    if default_storage.exists(name):
+        return name
+
+    pdf = pdfium.PdfDocument(f)
+    try:
+        page = pdf[0]
+        width = getattr(settings, 'PAPER_THUMBNAIL_WIDTH', 240)
+        image = page.render(scale=width / page.get_width()).to_pil()
+    finally:
+        pdf.close()
+
+    data = io.BytesIO()
+    image.save(data, 'WEBP', quality=getattr(settings, 'PAPER_THUMBNAIL_QUALITY', 70))
+    return default_storage.save(name, ContentFile(data.getvalue()))
+
+
+def delete_thumbnail(digest):
+    default_storage.delete(thumbnail_name(digest))
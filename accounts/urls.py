@@ -19,9 +19,16 @@ urlpatterns = [
     path('manage-papers/<str:branch>/', views.manage_papers_view, name='manage_papers'),
     path('delete-paper/<int:paper_id>/', views.delete_paper_view, name='delete_paper'),
     path('view-notes/<str:branch>/<str:semester>/', views.view_notes_view, name='view_notes'),
+    path('download/<int:paper_id>/', views.download_paper_view, name='download_paper'),
+    path('download-all/<str:branch>/<str:semester>/', views.download_all_view, name='download_all'),
+    path('thumbnail/<int:paper_id>/<str:filename>', views.paper_thumbnail_view, name='paper_thumbnail'),
+    path('search/', views.search_papers_view, name='search_papers'),
     path('internships/<str:branch>/', views.internships_view, name='internships'),
     path('student-upload-verify/<str:branch>/<str:semester>/', views.student_upload_verify_view, name='student_upload_verify'),
     path('student-upload-form/<str:branch>/<str:semester>/', views.student_upload_form_view, name='student_upload_form'),
+    path('chunked-upload/init/<str:branch>/<str:semester>/', views.chunked_upload_init_view, name='chunked_upload_init'),
+    path('chunked-upload/<uuid:upload_id>/', views.chunked_upload_view, name='chunked_upload'),
+    path('chunked-upload/<uuid:upload_id>/finalize/', views.chunked_upload_finalize_view, name='chunked_upload_finalize'),
     path('dashboard/', views.dashboard_view, name='dashboard'),
     path('logout/', views.logout_view, name='logout'),
 ]
\ No newline at end of file